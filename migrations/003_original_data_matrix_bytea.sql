@@ -0,0 +1,13 @@
+-- マイグレーション: 元データ行列をバイナリ形式で保存
+-- 作成日: 2026-10-17
+-- 説明: original_data に np.save 形式のバイト列（BYTEA）を保存する
+--       data_matrix_blob カラムを追加し、保存時のメモリ使用量を削減
+
+-- 1. data_matrix_blob カラムを追加（既存の JSONB の data_matrix はそのまま残し、
+--    blob がない行は読み出し時に data_matrix から復元する）
+ALTER TABLE original_data
+ADD COLUMN IF NOT EXISTS data_matrix_blob BYTEA;
+
+-- ロールバック
+-- ALTER TABLE original_data
+-- DROP COLUMN IF EXISTS data_matrix_blob;
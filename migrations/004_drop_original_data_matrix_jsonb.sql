@@ -0,0 +1,13 @@
+-- マイグレーション: 旧形式の元データ行列を削除
+-- 作成日: 2026-10-17
+-- 説明: 003 で追加した data_matrix_blob への移行後、JSONB の data_matrix を削除
+--       ※ OriginalData モデルから data_matrix を外したリリースの後に適用すること
+--         （apply_migrations.sh には含めていない）
+
+-- 1. data_matrix カラムを削除（元データは csv_data と data_matrix_blob に残る）
+ALTER TABLE original_data
+DROP COLUMN IF EXISTS data_matrix;
+
+-- ロールバック（列は戻るが、削除した値は復元できない）
+-- ALTER TABLE original_data
+-- ADD COLUMN data_matrix JSONB;
@@ -14,4 +14,7 @@ export PGPASSWORD=$DB_PASSWORD
 echo "Applying migration 002_add_analysis_type.sql..."
 psql -h $DB_HOST -p $DB_PORT -U $DB_USER -d $DB_NAME -f migrations/002_add_analysis_type.sql
 
+echo "Applying migration 003_original_data_matrix_bytea.sql..."
+psql -h $DB_HOST -p $DB_PORT -U $DB_USER -d $DB_NAME -f migrations/003_original_data_matrix_bytea.sql
+
 echo "Migration completed successfully!"
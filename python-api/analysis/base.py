@@ -1,6 +1,10 @@
 # python-api/analysis/base.py
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Dict, Any
+import logging
+import numpy as np
+import orjson
 import pandas as pd
 import matplotlib.pyplot as plt
 import matplotlib.font_manager as fm
@@ -9,10 +13,100 @@ import base64
 from datetime import datetime
 from sqlalchemy.orm import Session
 
+logger = logging.getLogger(__name__)
+
+
+# 日本語を表示できるフォントファミリーの優先順
+JAPANESE_FONT_FAMILIES = ("IPAexGothic", "IPAGothic", "DejaVu Sans")
+
+
+@lru_cache(maxsize=1)
+def resolve_japanese_font() -> str:
+    """利用可能な最初のフォントファミリー名を一度だけ解決して返す
+
+    fontfamily にリストを渡すと描画のたびに各候補をフォントキャッシュから
+    探し直すため、インストール済みの1つに絞って文字列で渡す。
+    """
+    installed = {font.name for font in fm.fontManager.ttflist}
+    return next(
+        (family for family in JAPANESE_FONT_FAMILIES if family in installed),
+        "sans-serif",
+    )
+
+
+# rcParams に設定する日本語フォントファイルの候補
+JAPANESE_FONT_PATHS = (
+    "/usr/share/fonts/opentype/ipaexfont-gothic/ipaexg.ttf",
+    "/usr/share/fonts/truetype/fonts-japanese-gothic.ttf",
+    "/usr/share/fonts/opentype/ipafont-gothic/ipagp.ttf",
+    "/usr/share/fonts/truetype/takao-gothic/TakaoPGothic.ttf",
+)
+
+
+@lru_cache(maxsize=1)
+def _ensure_japanese_font() -> None:
+    """日本語フォントを rcParams に一度だけ設定する
+
+    候補のフォントファイルを開いて名前を読むのはプロセスごとに1回で十分なので、
+    プロットのたびに繰り返さない。
+    """
+    try:
+        # 利用可能なフォントを検索
+        font_prop = None
+        for font_path in JAPANESE_FONT_PATHS:
+            try:
+                font_prop = fm.FontProperties(fname=font_path)
+                plt.rcParams["font.family"] = font_prop.get_name()
+                logger.debug("Japanese font set to: %s", font_prop.get_name())
+                break
+            except:
+                continue
+
+        if not font_prop:
+            logger.warning("Japanese font not found, using default font")
+            plt.rcParams["font.family"] = ["DejaVu Sans", "sans-serif"]
+
+        # フォント設定
+        plt.rcParams["axes.unicode_minus"] = False
+        logger.debug("Japanese font setup completed")
+
+    except Exception as e:
+        logger.error("Font setup error: %s", e)
+        plt.rcParams["font.family"] = ["DejaVu Sans", "sans-serif"]
+
+
+def _json_default(obj):
+    """orjson が直接扱えない値（非連続配列・pandas オブジェクトなど）の変換"""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, (pd.DataFrame, pd.Series, pd.Index)):
+        return obj.to_numpy().tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    return str(obj)
+
+
+def serialize_results(results: Dict[str, Any]) -> str:
+    """分析結果を JSON 文字列に変換
+
+    NumPy 配列は orjson がリストに展開せずそのまま書き出すため、
+    要素ごとの Python オブジェクトを作らずに済む。
+    """
+    return orjson.dumps(
+        results,
+        default=_json_default,
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+    ).decode("utf-8")
+
 
 class BaseAnalyzer(ABC):
     """分析基底クラス"""
 
+    @property
+    def japanese_font(self) -> str:
+        """テキスト描画に使う日本語フォントファミリー"""
+        return resolve_japanese_font()
+
     @abstractmethod
     def get_analysis_type(self) -> str:
         """分析タイプを返す（各サブクラスでオーバーライド）"""
@@ -30,45 +124,19 @@ class BaseAnalyzer(ABC):
 
     def setup_japanese_font(self):
         """日本語フォントの設定"""
-        try:
-            # 利用可能なフォントを検索
-            font_paths = [
-                "/usr/share/fonts/opentype/ipaexfont-gothic/ipaexg.ttf",
-                "/usr/share/fonts/truetype/fonts-japanese-gothic.ttf",
-                "/usr/share/fonts/opentype/ipafont-gothic/ipagp.ttf",
-                "/usr/share/fonts/truetype/takao-gothic/TakaoPGothic.ttf",
-            ]
-
-            font_prop = None
-            for font_path in font_paths:
-                try:
-                    font_prop = fm.FontProperties(fname=font_path)
-                    plt.rcParams["font.family"] = font_prop.get_name()
-                    print(f"Japanese font set to: {font_prop.get_name()}")
-                    break
-                except:
-                    continue
-
-            if not font_prop:
-                print("Warning: Japanese font not found, using default font")
-                plt.rcParams["font.family"] = ["DejaVu Sans", "sans-serif"]
-
-            # フォント設定
-            plt.rcParams["axes.unicode_minus"] = False
-            print("Japanese font setup completed")
+        _ensure_japanese_font()
 
-        except Exception as e:
-            print(f"Font setup error: {e}")
-            plt.rcParams["font.family"] = ["DejaVu Sans", "sans-serif"]
+    def save_plot_as_base64(self, fig, bbox_inches="tight") -> str:
+        """プロットをBase64エンコードして返す
 
-    def save_plot_as_base64(self, fig) -> str:
-        """プロットをBase64エンコードして返す"""
+        fig.tight_layout() 済みの図は bbox_inches=None を渡すと、余白を測るための
+        追加の描画パスを省いて図のサイズのまま保存する。
+        """
         buffer = io.BytesIO()
         fig.savefig(
-            buffer, format="png", dpi=300, bbox_inches="tight", facecolor="white"
+            buffer, format="png", dpi=300, bbox_inches=bbox_inches, facecolor="white"
         )
-        buffer.seek(0)
-        image_base64 = base64.b64encode(buffer.read()).decode("utf-8")
+        image_base64 = base64.b64encode(buffer.getvalue()).decode("utf-8")
         buffer.close()
         plt.close(fig)
         return image_base64
@@ -105,8 +173,8 @@ class BaseAnalyzer(ABC):
             db.flush()
 
             session_id = session.session_id
-            print(
-                f"セッション作成完了: ID={session_id}, Type={self.get_analysis_type()}"
+            logger.debug(
+                "セッション作成完了: ID=%s, Type=%s", session_id, self.get_analysis_type()
             )
 
             # タグの追加
@@ -115,12 +183,13 @@ class BaseAnalyzer(ABC):
                     tag = SessionTag(session_id=session_id, tag_name=tag_name.strip())
                     db.add(tag)
 
-            # 分析データの保存
+            # 分析データの保存（Text カラムなので JSON 文字列にして1回だけ変換）
+            results_json = serialize_results(results)
             analysis_data = AnalysisData(
                 session_id=session_id,
                 analysis_type=self.get_analysis_type(),
-                parameters=results,
-                results=results,
+                parameters=results_json,
+                results=results_json,
             )
             db.add(analysis_data)
 
@@ -135,10 +204,8 @@ class BaseAnalyzer(ABC):
 
         except Exception as e:
             db.rollback()
-            print(f"データベース保存エラー: {e}")
-            import traceback
-
-            print(f"詳細:\n{traceback.format_exc()}")
+            logger.error("データベース保存エラー: %s", e)
+            logger.debug("データベース保存エラー詳細", exc_info=True)
             raise
 
     def _save_coordinates_data(
@@ -170,13 +237,11 @@ class BaseAnalyzer(ABC):
             db.add(viz_data)
             db.flush()
 
-            print(f"可視化データ保存完了: {len(plot_base64)}文字")
+            logger.debug("可視化データ保存完了: %d文字", len(plot_base64))
 
         except Exception as e:
-            print(f"可視化データ保存エラー: {e}")
-            import traceback
-
-            print(f"詳細:\n{traceback.format_exc()}")
+            logger.error("可視化データ保存エラー: %s", e)
+            logger.debug("可視化データ保存エラー詳細", exc_info=True)
             raise
 
     def run_full_analysis(
@@ -193,7 +258,7 @@ class BaseAnalyzer(ABC):
     ) -> Dict[str, Any]:
         """完全な分析パイプラインを実行"""
         try:
-            print("=== データベース保存開始 ===")
+            logger.debug("=== データベース保存開始 ===")
 
             # 分析の実行
             results = self.analyze(df, **kwargs)
@@ -220,14 +285,12 @@ class BaseAnalyzer(ABC):
                 results, df, session_id, session_name, file, plot_base64
             )
 
-            print("=== データベース保存完了 ===")
+            logger.debug("=== データベース保存完了 ===")
             return response
 
         except Exception as e:
-            print(f"データベース保存で致命的エラー: {e}")
-            import traceback
-
-            print(f"詳細:\n{traceback.format_exc()}")
+            logger.error("データベース保存で致命的エラー: %s", e)
+            logger.debug("致命的エラー詳細", exc_info=True)
 
             # エラーが発生してもレスポンスを返す（session_idなし）
             try:
@@ -1,27 +1,333 @@
 # python-api/analysis/cluster.py
 from typing import Dict, Any, List, Optional
+from collections import OrderedDict
+from functools import lru_cache
+from hashlib import blake2b
+import logging
+import threading
 import pandas as pd
 import numpy as np
+import matplotlib
+
+matplotlib.use("Agg")  # GUI無効化
+
 import matplotlib.pyplot as plt
-from sklearn.cluster import KMeans, AgglomerativeClustering, DBSCAN
+from matplotlib.figure import Figure
+from sklearn import config_context
+from sklearn.cluster import KMeans, MiniBatchKMeans, AgglomerativeClustering, DBSCAN
 from sklearn.preprocessing import StandardScaler
-from sklearn.metrics import (
-    silhouette_score,
-    calinski_harabasz_score,
-    davies_bouldin_score,
-)
 from sklearn.decomposition import PCA
+from sklearn.utils.parallel import Parallel, delayed
+from scipy import sparse
 from scipy.cluster.hierarchy import dendrogram, linkage
+from scipy.spatial.distance import squareform
 import seaborn as sns
 from .base import BaseAnalyzer
 
+logger = logging.getLogger(__name__)
+
+# シルエット係数の計算に使う最大サンプル数（ペアワイズ距離が O(n²) のため）
+SILHOUETTE_SAMPLE_SIZE = 2000
+
+# これを超えるサンプル数の K-means はミニバッチで学習する
+MINIBATCH_KMEANS_THRESHOLD = 10_000
+
+# サンプル数 × K × 特徴量数がこれを超える K-means は初期化の試行を1回にする
+# （試行回数が実行時間にそのまま掛かり、k-means++ 初期化なら1回でもほぼ同等の解になる）
+KMEANS_SINGLE_INIT_WORK = 10**7
+
+# 階層クラスタリングでデンドログラム用のリンケージ行列を保持する最大サンプル数
+MAX_DENDROGRAM_SAMPLES = 200
+
+# エルボー法を描くのに必要な最小サンプル数（K=2..n-1 の掃引が意味を持つ範囲）
+ELBOW_MIN_SAMPLES = 6
+
+# エルボー法で numba の Lloyd カーネルを使う最大サンプル数（これを超えると
+# ミニバッチで間引く MiniBatchKMeans の方が速い）
+ELBOW_JIT_MAX_SAMPLES = 5000
+
+# 評価指標（重心ベースの指標とシルエット係数）をスレッドで並行計算する最小サンプル数
+# （小さいデータではスレッド起動のオーバーヘッドの方が大きい）
+PARALLEL_METRICS_MIN_SAMPLES = 1000
+
+# 可視化用PCAで乱択SVDに切り替える最小特徴量数（2成分だけ求めるので、
+# 特徴量が多いと完全なSVDより速い。少ない場合は完全なSVDの方が速く正確）
+PCA_RANDOMIZED_MIN_FEATURES = 100
+
+# sklearn の距離計算をチャンク分割するときの作業メモリ上限（MB）
+PAIRWISE_WORKING_MEMORY_MB = 256
+
+# 同じ分析結果の再描画を避けるためのプロットキャッシュ（リクエストごとに
+# ClusterAnalyzer が作られるのでモジュール単位で保持する）
+PLOT_CACHE_SIZE = 8
+_plot_cache: "OrderedDict[bytes, str]" = OrderedDict()
+_plot_cache_lock = threading.Lock()
+
+# 同じデータ・同じパラメータの再分析（セッションの再読み込みなど）を省くための
+# 分析結果キャッシュ。キーにはユーザーIDも含め、ユーザーをまたいで共有しない
+RESULT_CACHE_SIZE = 8
+_result_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+_result_cache_lock = threading.Lock()
+
+# 必須でないライブラリは条件付きインポート
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    logger.warning("numba not available, using MiniBatchKMeans for the elbow sweep")
+    prange = range
+
+    def njit(*args, **kwargs):
+        """numba 未導入時のダミー（JIT 対象の関数は呼び出されない）"""
+        return lambda func: func
+
+
+def _binary_euclidean_distances(
+    X_bits: np.ndarray, squared: bool = False
+) -> np.ndarray:
+    """0/1 行列のユークリッド距離行列を ||a||² + ||b||² - 2a·b の展開で求める
+
+    0/1 データではユークリッド距離の2乗とハミング距離が一致し、行ノルムの2乗は
+    1 の個数になる。各項は整数なので float32 の GEMM でも誤差なく計算でき、
+    結果は pdist(metric="euclidean") と同じになる。
+    squared=True なら平方根を取らずに距離の2乗（＝ハミング距離）を返す。
+    """
+    bits = np.ascontiguousarray(X_bits, dtype=np.float32)
+    ones = bits.sum(axis=1)
+    distances = ones[:, None] + ones[None, :] - 2.0 * (bits @ bits.T)
+    np.maximum(distances, 0.0, out=distances)
+    if squared:
+        return distances.astype(np.float64)
+    return np.sqrt(distances, dtype=np.float64)
+
+
+# 最良値の初期値に np.inf を使うので、fastmath のうち無限大・NaN がないと
+# 仮定するフラグ（ninf, nnan）は外し、演算の並べ替えなどだけを許可する
+@njit(cache=True, fastmath={"nsz", "arcp", "contract", "reassoc"})
+def _kmeans_inertia(
+    X: np.ndarray, k: int, seed: int, n_init: int, max_iter: int
+) -> float:
+    """k-means++ 初期化 + Lloyd 法で得られる最小の慣性（n_init 回の試行中）"""
+    n, d = X.shape
+    np.random.seed(seed)
+    best_inertia = np.inf
+    centers = np.empty((k, d), dtype=np.float64)
+    sums = np.empty((k, d), dtype=np.float64)
+    counts = np.empty(k, dtype=np.int64)
+    labels = np.empty(n, dtype=np.int64)
+    min_d2 = np.empty(n, dtype=np.float64)
+
+    for _ in range(n_init):
+        # k-means++ 初期化
+        first = np.random.randint(n)
+        for j in range(d):
+            centers[0, j] = X[first, j]
+        for i in range(n):
+            dist = 0.0
+            for j in range(d):
+                diff = X[i, j] - centers[0, j]
+                dist += diff * diff
+            min_d2[i] = dist
+        for c in range(1, k):
+            total = min_d2.sum()
+            chosen = n - 1
+            if total > 0.0:
+                threshold = np.random.random() * total
+                acc = 0.0
+                for i in range(n):
+                    acc += min_d2[i]
+                    if acc >= threshold:
+                        chosen = i
+                        break
+            else:
+                chosen = np.random.randint(n)
+            for j in range(d):
+                centers[c, j] = X[chosen, j]
+            for i in range(n):
+                dist = 0.0
+                for j in range(d):
+                    diff = X[i, j] - centers[c, j]
+                    dist += diff * diff
+                if dist < min_d2[i]:
+                    min_d2[i] = dist
+
+        # Lloyd 反復（割り当てが変わらなくなったら終了）
+        labels[:] = -1
+        converged = False
+        inertia = 0.0
+        for _ in range(max_iter):
+            changed = False
+            inertia = 0.0
+            for i in range(n):
+                best_c = 0
+                best_dist = np.inf
+                for c in range(k):
+                    dist = 0.0
+                    for j in range(d):
+                        diff = X[i, j] - centers[c, j]
+                        dist += diff * diff
+                    if dist < best_dist:
+                        best_dist = dist
+                        best_c = c
+                inertia += best_dist
+                if labels[i] != best_c:
+                    labels[i] = best_c
+                    changed = True
+            if not changed:
+                # 中心は直前の割り当てから更新されていないので、この走査の
+                # 最近傍距離の和がそのまま慣性になる
+                converged = True
+                break
+
+            sums[:] = 0.0
+            counts[:] = 0
+            for i in range(n):
+                c = labels[i]
+                counts[c] += 1
+                for j in range(d):
+                    sums[c, j] += X[i, j]
+            for c in range(k):
+                if counts[c] > 0:  # 空クラスターは直前の中心を維持
+                    for j in range(d):
+                        centers[c, j] = sums[c, j] / counts[c]
+
+        if not converged:
+            # max_iter に達した場合は最後に更新した中心で慣性を求め直す
+            inertia = 0.0
+            for i in range(n):
+                best_dist = np.inf
+                for c in range(k):
+                    dist = 0.0
+                    for j in range(d):
+                        diff = X[i, j] - centers[c, j]
+                        dist += diff * diff
+                    if dist < best_dist:
+                        best_dist = dist
+                inertia += best_dist
+        if inertia < best_inertia:
+            best_inertia = inertia
+
+    return best_inertia
+
+
+@njit(cache=True, parallel=True)
+def _elbow_inertias(
+    X: np.ndarray, ks: np.ndarray, n_inits: np.ndarray, seed: int
+) -> np.ndarray:
+    """各 K の慣性を並列に計算（K ごとに独立なので prange で分割）"""
+    out = np.empty(len(ks), dtype=np.float64)
+    for i in prange(len(ks)):
+        out[i] = _kmeans_inertia(X, ks[i], seed, n_inits[i], 100)
+    return out
+
+
+def kmeans_n_init(
+    n_samples: int, n_clusters: int, n_features: int, n_init: int
+) -> int:
+    """K-means の初期化の試行回数（計算量が大きいデータでは1回に減らす）"""
+    if n_samples * n_clusters * n_features > KMEANS_SINGLE_INIT_WORK:
+        return 1
+    return n_init
+
+
+@lru_cache(maxsize=32)
+def _set3_lut(k: int) -> np.ndarray:
+    """クラスター数 k に対応する Set3 の RGBA 配列（描画のたびに補間し直さないようキャッシュ）"""
+    colors = plt.cm.Set3(np.linspace(0, 1, k))
+    colors.flags.writeable = False
+    return colors
+
+
+def _cut_linkage(Z: np.ndarray, n_clusters: int) -> np.ndarray:
+    """リンケージ行列を併合順に n_clusters 個のクラスターへ切り分ける
+
+    fcluster(maxclust) や cut_tree は併合の高さで切る・並べ直すため、二値データや
+    リッカート尺度のように高さが同じ併合が多いと指定より少ないクラスター数に
+    なったり、sklearn と異なる分割になったりする。ここでは sklearn と同じく
+    Z の最後の n_clusters - 1 回の併合だけを取り消す。
+    """
+    n = len(Z) + 1
+    n_merges = max(n - n_clusters, 0)
+    root = np.arange(n + n_merges)
+    children = Z[:n_merges, :2].astype(np.int64)
+    root[children[:, 0]] = np.arange(n, n + n_merges)
+    root[children[:, 1]] = np.arange(n, n + n_merges)
+
+    # 親の番号は子より大きいので、番号の大きい順にたどれば根が1パスで決まる
+    for node in range(n + n_merges - 1, -1, -1):
+        root[node] = root[root[node]]
+
+    return np.unique(root[:n], return_inverse=True)[1]
+
+
+def _truncate_linkage(Z: np.ndarray, p: int):
+    """リンケージ行列を上位 p-1 回の併合だけに切り詰める（truncate_mode="lastp" 相当）
+
+    dendrogram に全体の Z を渡すと lastp 指定でも木全体を走査するため、
+    上位の併合だけを p 葉の独立したリンケージ行列として作り直す。
+    葉ラベルは scipy の lastp 表示と同じく、単独サンプルは番号、
+    併合済みクラスターは "(サンプル数)" とする。
+    """
+    n = len(Z) + 1
+    m = p - 1
+    first_top = n + (n - 1 - m)
+
+    top = np.array(Z[-m:], dtype=np.float64)
+    children = top[:, :2].astype(np.int64).ravel()
+    is_leaf = children < first_top
+
+    # 切り捨てた部分木は出現順に 0..p-1 の葉、上位の併合は p 以降に振り直す
+    leaf_ids = np.cumsum(is_leaf) - 1
+    top[:, :2] = np.where(is_leaf, leaf_ids, children - first_top + p).reshape(-1, 2)
+
+    # 4列目は切り詰め後の葉数で数え直す（scipy の妥当性チェックで元の件数は弾かれる）
+    sizes = np.ones(p + m, dtype=np.int64)
+    for k in range(m):
+        sizes[p + k] = sizes[int(top[k, 0])] + sizes[int(top[k, 1])]
+    top[:, 3] = sizes[p:]
+
+    leaf_nodes = children[is_leaf]
+    leaf_labels = [
+        str(node) if node < n else f"({int(Z[node - n, 3])})" for node in leaf_nodes
+    ]
+    return top, leaf_labels
+
 
 class ClusterAnalyzer(BaseAnalyzer):
     """クラスター解析クラス - シンプル版"""
 
+    def __init__(self):
+        # 全列が 0/1 の未標準化データでは二値データ専用の距離計算を使う
+        self._binary_mode = False
+        # run_full_analysis では保存とレスポンス作成で同じ座標を使うため、
+        # 直近の変換結果を元の配列と組で保持する（配列への参照があるので id は再利用されない）
+        self._coordinate_cache = None
+        # 分析結果キャッシュの持ち主（run_full_analysis で設定）
+        self._cache_owner = None
+
     def get_analysis_type(self) -> str:
         return "cluster"
 
+    def run_full_analysis(
+        self,
+        df: pd.DataFrame,
+        db,
+        session_name: str,
+        description: str,
+        tags: list,
+        user_id: str,
+        file,
+        csv_text: str,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """完全な分析パイプラインを実行（分析結果のキャッシュはユーザーごとに分ける）"""
+        self._cache_owner = user_id
+        return super().run_full_analysis(
+            df, db, session_name, description, tags, user_id, file, csv_text, **kwargs
+        )
+
     def analyze(
         self,
         df: pd.DataFrame,
@@ -32,61 +338,145 @@ class ClusterAnalyzer(BaseAnalyzer):
     ) -> Dict[str, Any]:
         """クラスター解析を実行"""
         try:
-            print(f"=== クラスター分析開始 ===")
-            print(f"手法: {method}, クラスター数: {n_clusters}, 標準化: {standardize}")
+            logger.debug("=== クラスター分析開始 ===")
+            logger.debug(
+                "手法: %s, クラスター数: %s, 標準化: %s", method, n_clusters, standardize
+            )
+
+            # 同じデータ・パラメータの結果があれば再計算しない（プロットも
+            # 結果の内容をキーにキャッシュしているので、描画も省かれる）
+            cache_key = self._result_cache_key(
+                df, method, n_clusters, standardize, kwargs
+            )
+            with _result_cache_lock:
+                cached = _result_cache.get(cache_key)
+                if cached is not None:
+                    _result_cache.move_to_end(cache_key)
+                    logger.debug("分析結果キャッシュを使用")
+                    return dict(cached)
 
             # データの前処理
-            df_processed = self._preprocess_data(df, standardize)
+            data = self._preprocess_data(df, standardize)
+
+            # 以降の学習・評価・エルボー計算はすべてこの配列を共有する
+            # （変換とコピーを各処理で繰り返さない）
+            X = np.ascontiguousarray(data, dtype=np.float32)
+
+            # sklearn の有限値チェック（全要素の走査）はここで一度だけ行い、各 fit では省略する
+            # （非有限値を含む場合は従来どおり sklearn 側で検証させる）。
+            # 近傍探索などの距離行列はチャンク単位で作らせ、メモリを一定に抑える
+            with config_context(
+                assume_finite=bool(np.isfinite(X).all()),
+                working_memory=PAIRWISE_WORKING_MEMORY_MB,
+            ):
+                # クラスター分析の実行
+                cluster_result = self._perform_clustering(
+                    X, method, n_clusters, **kwargs
+                )
+                labels = cluster_result["labels"]
 
-            # クラスター分析の実行
-            cluster_result = self._perform_clustering(
-                df_processed, method, n_clusters, **kwargs
-            )
+                # DBSCAN のラベルは 0 始まりの連番（ノイズは -1）なので最大値からクラスター数を決定
+                if method == "dbscan":
+                    n_clusters = int(labels.max()) + 1 if labels.size else 0
 
-            # 評価指標の計算
-            evaluation_metrics = self._calculate_evaluation_metrics(
-                df_processed, cluster_result["labels"]
-            )
+                # クラスターごとの件数は一度だけ数え、評価指標とクラスターサイズで共有する
+                label_counts = np.bincount(labels[labels >= 0], minlength=n_clusters)
+
+                # 評価指標の計算
+                # 二値データではクラスタリングで求めた距離行列をシルエット係数に再利用
+                evaluation_metrics = self._calculate_evaluation_metrics(
+                    X, labels, cluster_result.get("squared_distances"), label_counts
+                )
+
+                # エルボー法の慣性は前処理済み行列から一度だけ計算しておき、プロットで再利用
+                # （K-means 以外や小さすぎるデータでは適用外なので計算しない）
+                elbow_inertias = None
+                if self._elbow_applicable(method, len(X)):
+                    elbow_inertias = self._compute_inertias(
+                        X, range(2, min(10, len(X) - 1) + 1)
+                    )
 
-            # PCA による次元削減（可視化用）
-            pca_result = self._perform_pca(df_processed)
+                # PCA による次元削減（可視化用）
+                pca_result = self._perform_pca(data)
+
+            # 寄与率は1つのリストを共有し、累積値と総和は cumsum の1パスで求める
+            explained_variance_ratio = pca_result["explained_variance_ratio"]
+            cumulative_ratio = np.cumsum(explained_variance_ratio)
 
             # 結果をまとめる
             results = {
                 "method": method,
                 "n_clusters": n_clusters,
-                "labels": cluster_result["labels"].tolist(),
+                "labels": labels,
                 "cluster_centers": cluster_result.get("centers"),
                 "dendrogram_data": cluster_result.get("dendrogram_data"),
                 "evaluation_metrics": evaluation_metrics,
                 "pca_coordinates": pca_result["coordinates"],
-                "pca_explained_variance_ratio": pca_result["explained_variance_ratio"],
-                "cluster_sizes": [
-                    int(np.sum(cluster_result["labels"] == i))
-                    for i in range(n_clusters)
-                ],
-                "sample_names": df.index.tolist(),
-                "feature_names": df.columns.tolist(),
+                "pca_explained_variance_ratio": explained_variance_ratio,
+                "pca_components": pca_result["components"],
+                "pca_mean": pca_result["mean"],
+                "elbow_inertias": elbow_inertias,
+                "cluster_sizes": label_counts.tolist(),
+                # 名前は保存・レスポンスで文字列として使うので、ここで一括変換しておく
+                # （利用側で要素ごとに str() を呼ばない）
+                "sample_names": df.index.astype(str).tolist(),
+                "feature_names": df.columns.astype(str).tolist(),
                 # BaseAnalyzer の save_to_database で使用される標準フィールド
-                "eigenvalues": pca_result["explained_variance_ratio"],
-                "explained_inertia": pca_result["explained_variance_ratio"],
-                "cumulative_inertia": np.cumsum(
-                    pca_result["explained_variance_ratio"]
-                ).tolist(),
-                "total_inertia": float(np.sum(pca_result["explained_variance_ratio"])),
+                "eigenvalues": explained_variance_ratio,
+                "explained_inertia": explained_variance_ratio,
+                "cumulative_inertia": cumulative_ratio.tolist(),
+                "total_inertia": (
+                    float(cumulative_ratio[-1]) if cumulative_ratio.size else 0.0
+                ),
             }
 
-            print(f"クラスター分析完了")
-            return results
+            with _result_cache_lock:
+                _result_cache[cache_key] = results
+                if len(_result_cache) > RESULT_CACHE_SIZE:
+                    _result_cache.popitem(last=False)
+
+            logger.debug("クラスター分析完了")
+            return dict(results)
 
         except Exception as e:
-            print(f"分析エラー: {str(e)}")
+            logger.error("分析エラー: %s", e)
             raise
 
+    def _result_cache_key(
+        self,
+        df: pd.DataFrame,
+        method: str,
+        n_clusters: int,
+        standardize: bool,
+        params: Dict[str, Any],
+    ) -> bytes:
+        """データ内容・分析パラメータ・ユーザーIDのハッシュ"""
+        key = blake2b(digest_size=16)
+        key.update(
+            repr(
+                (
+                    self._cache_owner,
+                    method,
+                    n_clusters,
+                    standardize,
+                    sorted(params.items()),
+                    df.columns.tolist(),
+                    df.dtypes.tolist(),
+                )
+            ).encode()
+        )
+        # 行ごとのハッシュ（インデックス込み）は dtype に関わらずベクトル化して求まる
+        key.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+        return key.digest()
+
     def _preprocess_data(
         self, df: pd.DataFrame, standardize: bool = True
-    ) -> pd.DataFrame:
-        """データの前処理"""
+    ) -> np.ndarray:
+        """データの前処理（数値列のみの float64 配列を返す）
+
+        行名・列名は元の df から取得するので、標準化結果を DataFrame に
+        包み直すことはしない。
+        """
         # 基底クラスの前処理を使用
         df_clean = self.preprocess_data(df)
 
@@ -95,268 +485,500 @@ class ClusterAnalyzer(BaseAnalyzer):
         if len(numeric_cols) == 0:
             raise ValueError("数値データが見つかりません")
 
-        df_numeric = df_clean[numeric_cols]
+        # 配列への変換は1回だけ行う。標準化する場合は元の df と共有しないコピーにして
+        # その場で変換し、しない場合は変換不要ならコピーせずにそのまま使う
+        values = df_clean[numeric_cols].to_numpy(dtype=np.float64, copy=standardize)
+
+        # 二値データの検出（標準化すると 0/1 でなくなるため未標準化時のみ）
+        self._binary_mode = not standardize and bool(np.isin(values, (0, 1)).all())
+        if self._binary_mode:
+            logger.debug("二値データを検出: ハミング距離（GEMM 展開）で距離計算します")
 
         # 標準化
         if standardize:
-            scaler = StandardScaler()
-            df_scaled = pd.DataFrame(
-                scaler.fit_transform(df_numeric),
-                index=df_numeric.index,
-                columns=df_numeric.columns,
-            )
-            return df_scaled
+            return StandardScaler(copy=False).fit_transform(values)
 
-        return df_numeric
+        return values
 
     def _perform_clustering(
-        self, df: pd.DataFrame, method: str, n_clusters: int, **kwargs
+        self, X: np.ndarray, method: str, n_clusters: int, **kwargs
     ) -> Dict[str, Any]:
-        """クラスタリングの実行"""
+        """クラスタリングの実行（X は C 連続の float32 配列）"""
         if method == "kmeans":
-            return self._kmeans_clustering(df, n_clusters, **kwargs)
+            return self._kmeans_clustering(X, n_clusters, **kwargs)
         elif method == "hierarchical":
-            return self._hierarchical_clustering(df, n_clusters, **kwargs)
+            return self._hierarchical_clustering(X, n_clusters, **kwargs)
         elif method == "dbscan":
-            return self._dbscan_clustering(df, **kwargs)
+            return self._dbscan_clustering(X, **kwargs)
         else:
             raise ValueError(f"サポートされていない手法です: {method}")
 
     def _kmeans_clustering(
-        self, df: pd.DataFrame, n_clusters: int, **kwargs
+        self, X: np.ndarray, n_clusters: int, **kwargs
     ) -> Dict[str, Any]:
         """K-meansクラスタリング"""
         random_state = kwargs.get("random_state", 42)
 
-        kmeans = KMeans(n_clusters=n_clusters, random_state=random_state, n_init=10)
-        labels = kmeans.fit_predict(df)
+        if len(X) > MINIBATCH_KMEANS_THRESHOLD:
+            # 大規模データは全件の Lloyd 反復を10回繰り返すと重いため、
+            # ミニバッチ学習に切り替えて初期化回数も減らす
+            kmeans = MiniBatchKMeans(
+                n_clusters=n_clusters,
+                batch_size=1024,
+                n_init=kmeans_n_init(len(X), n_clusters, X.shape[1], 3),
+                random_state=random_state,
+            )
+        else:
+            # Elkan 法は反復ごとの距離計算を三角不等式で省けるが、(n, k) の境界配列の
+            # 更新が重く、重なりのある実データでは lloyd の方が速いため既定は lloyd。
+            # よく分離したクラスターでは algorithm="elkan" を指定できる
+            kmeans = KMeans(
+                n_clusters=n_clusters,
+                random_state=random_state,
+                n_init=kmeans_n_init(len(X), n_clusters, X.shape[1], 10),
+                algorithm=kwargs.get("algorithm", "lloyd"),
+            )
+        labels = kmeans.fit_predict(X)
 
         return {
             "labels": labels,
-            "centers": kmeans.cluster_centers_.tolist(),
+            "centers": kmeans.cluster_centers_,
             "dendrogram_data": None,
         }
 
     def _hierarchical_clustering(
-        self, df: pd.DataFrame, n_clusters: int, **kwargs
+        self, X: np.ndarray, n_clusters: int, **kwargs
     ) -> Dict[str, Any]:
         """階層クラスタリング - デンドログラム生成改善版"""
         linkage_method = kwargs.get("linkage", "ward")
 
+        logger.debug(
+            "階層クラスタリング開始: method=%s, samples=%d, n_clusters=%d",
+            linkage_method,
+            len(X),
+            n_clusters,
+        )
+
+        # リンケージ行列を必ず計算（デンドログラムは小規模データのみ保持）
+        linkage_matrix = None
+        dendrogram_data = None
+        squared_distances = None
         try:
-            print(
-                f"階層クラスタリング開始: method={linkage_method}, samples={len(df)}, n_clusters={n_clusters}"
+            logger.debug("リンケージ計算開始: samples=%d", len(X))
+
+            # analyze で C 連続の float32 に変換済みなのでそのまま使う
+            data_array = X
+            logger.debug(
+                "データ配列準備完了: shape=%s, dtype=%s",
+                data_array.shape,
+                data_array.dtype,
             )
 
-            # sklearn で階層クラスタリング
-            from sklearn.cluster import AgglomerativeClustering
-
-            clustering = AgglomerativeClustering(
-                n_clusters=n_clusters, linkage=linkage_method
-            )
-            labels = clustering.fit_predict(df)
-            print(f"sklearn clustering完了: {len(np.unique(labels))} クラスター")
-
-            # デンドログラム用のリンケージ行列を必ず計算
-            dendrogram_data = None
-            try:
-                from scipy.cluster.hierarchy import linkage
-                import numpy as np
-
-                print(f"デンドログラム計算開始: samples={len(df)}")
-
-                # データ型の確認と修正
-                data_array = df.values.astype(np.float64)
-                print(
-                    f"データ配列準備完了: shape={data_array.shape}, dtype={data_array.dtype}"
+            # NaNや無限値のチェックと修正
+            if np.any(np.isnan(data_array)) or np.any(np.isinf(data_array)):
+                logger.debug("NaNまたは無限値を検出。データをクリーニングします。")
+                data_array = np.nan_to_num(
+                    data_array, nan=0.0, posinf=1e10, neginf=-1e10
                 )
 
-                # NaNや無限値のチェックと修正
-                if np.any(np.isnan(data_array)) or np.any(np.isinf(data_array)):
-                    print("NaNまたは無限値を検出。データをクリーニングします。")
-                    data_array = np.nan_to_num(
-                        data_array, nan=0.0, posinf=1e10, neginf=-1e10
-                    )
-
-                # リンケージ計算（サンプル数制限を緩和）
-                max_samples_for_dendrogram = 200  # 制限を100から200に拡大
-
-                if len(df) <= max_samples_for_dendrogram:
-                    if linkage_method == "ward":
-                        print("Ward法でリンケージ計算中...")
-                        dendrogram_data = linkage(
-                            data_array, method="ward", metric="euclidean"
-                        )
-                    else:
-                        print(f"{linkage_method}法でリンケージ計算中...")
-                        dendrogram_data = linkage(
-                            data_array, method=linkage_method, metric="euclidean"
-                        )
-
-                    print(f"リンケージ行列計算完了: shape={dendrogram_data.shape}")
-
-                    # リンケージ行列の妥当性チェック
-                    if dendrogram_data is not None:
-                        n_samples = len(df)
-                        if np.any(np.isnan(dendrogram_data)) or np.any(
-                            np.isinf(dendrogram_data)
-                        ):
-                            print(
-                                "リンケージ行列に無効な値があります。None に設定します。"
-                            )
-                            dendrogram_data = None
-                        elif dendrogram_data.shape[0] != n_samples - 1:
-                            print(
-                                f"リンケージ行列のサイズが不正です: {dendrogram_data.shape[0]} != {n_samples - 1}"
-                            )
-                            dendrogram_data = None
-                        else:
-                            print("✅ デンドログラム用リンケージ行列は正常です。")
-                else:
-                    print(
-                        f"サンプル数が多すぎます({len(df)})。デンドログラム計算をスキップ。"
-                    )
-                    dendrogram_data = None
+            # リンケージ計算。scipy の linkage は ward/complete/average/weighted に
+            # 最近傍チェイン法、single に最小全域木を使うので、サンプル数に関わらず
+            # scipy で木を作り併合順で切る（sklearn の AgglomerativeClustering も
+            # 内部では同じ scipy の linkage を呼び、同じ順で切っている）
+            if self._binary_mode and len(X) <= MAX_DENDROGRAM_SAMPLES:
+                logger.debug("%s法でリンケージ計算中（二値データ）...", linkage_method)
+                # 距離行列はシルエット係数でも再利用するので正方行列で保持する
+                squared_distances = _binary_euclidean_distances(
+                    data_array, squared=True
+                )
+                condensed = squareform(np.sqrt(squared_distances), checks=False)
+                linkage_matrix = linkage(condensed, method=linkage_method)
+            else:
+                logger.debug("%s法でリンケージ計算中...", linkage_method)
+                linkage_matrix = linkage(
+                    data_array, method=linkage_method, metric="euclidean"
+                )
 
-            except Exception as linkage_error:
-                print(f"リンケージ計算エラー: {linkage_error}")
-                import traceback
+            logger.debug("リンケージ行列計算完了: shape=%s", linkage_matrix.shape)
+
+            # リンケージ行列の妥当性チェック
+            n_samples = len(X)
+            if np.any(np.isnan(linkage_matrix)) or np.any(np.isinf(linkage_matrix)):
+                logger.debug("リンケージ行列に無効な値があります。None に設定します。")
+                linkage_matrix = None
+            elif linkage_matrix.shape[0] != n_samples - 1:
+                logger.debug(
+                    "リンケージ行列のサイズが不正です: %d != %d",
+                    linkage_matrix.shape[0],
+                    n_samples - 1,
+                )
+                linkage_matrix = None
+            else:
+                logger.debug("✅ リンケージ行列は正常です。")
 
-                print(f"リンケージエラー詳細:\n{traceback.format_exc()}")
-                dendrogram_data = None
+        except Exception as linkage_error:
+            logger.error("リンケージ計算エラー: %s", linkage_error)
+            logger.debug("リンケージエラー詳細", exc_info=True)
+            linkage_matrix = None
 
-            result = {
-                "labels": labels,
-                "centers": None,  # 階層クラスタリングには中心点がない
-                "dendrogram_data": dendrogram_data,
-            }
+        if linkage_matrix is not None:
+            # リンケージ行列から直接クラスタを切り出す（再クラスタリング不要）
+            labels = _cut_linkage(linkage_matrix, n_clusters)
+            logger.debug("リンケージ行列からラベル生成完了: labels=%d", len(labels))
 
-            print(
-                f"階層クラスタリング結果: labels={len(labels)}, dendrogram_available={'Yes' if dendrogram_data is not None else 'No'}"
+            if len(X) <= MAX_DENDROGRAM_SAMPLES:
+                # ラベル確定後は描画にしか使わないので float32 で保持（有効桁は十分）
+                dendrogram_data = linkage_matrix.astype(np.float32, copy=False)
+            else:
+                logger.debug(
+                    "サンプル数が多すぎます(%d)。デンドログラムは保持しません。",
+                    len(X),
+                )
+        else:
+            # リンケージ行列が得られない場合のみ sklearn で階層クラスタリング
+            clustering = AgglomerativeClustering(
+                n_clusters=n_clusters, linkage=linkage_method
             )
-            return result
+            labels = clustering.fit_predict(X)
+            logger.debug("sklearn clustering完了: labels=%d", len(labels))
 
-        except Exception as e:
-            print(f"階層クラスタリング全体エラー: {e}")
-            import traceback
-
-            print(f"階層エラー詳細:\n{traceback.format_exc()}")
-
-            # フォールバック: K-meansに切り替え
-            print("フォールバック: K-meansを使用します")
-            try:
-                from sklearn.cluster import KMeans
-
-                kmeans = KMeans(n_clusters=n_clusters, random_state=42, n_init=10)
-                labels = kmeans.fit_predict(df)
+        result = {
+            "labels": labels,
+            "centers": None,  # 階層クラスタリングには中心点がない
+            "dendrogram_data": dendrogram_data,
+            "squared_distances": squared_distances,
+        }
 
-                return {
-                    "labels": labels,
-                    "centers": kmeans.cluster_centers_,
-                    "dendrogram_data": None,
-                }
-            except Exception as fallback_error:
-                print(f"フォールバックエラー: {fallback_error}")
-                raise
+        logger.debug(
+            "階層クラスタリング結果: labels=%d, dendrogram_available=%s",
+            len(labels),
+            "Yes" if dendrogram_data is not None else "No",
+        )
+        return result
 
-    def _dbscan_clustering(self, df: pd.DataFrame, **kwargs) -> Dict[str, Any]:
+    def _dbscan_clustering(self, X: np.ndarray, **kwargs) -> Dict[str, Any]:
         """DBSCANクラスタリング"""
         eps = kwargs.get("eps", 0.5)
         min_samples = kwargs.get("min_samples", 5)
-
-        dbscan = DBSCAN(eps=eps, min_samples=min_samples)
-        labels = dbscan.fit_predict(df)
+        squared_distances = None
+
+        if self._binary_mode and len(X) <= SILHOUETTE_SAMPLE_SIZE:
+            # 近傍判定は d <= eps と d² <= eps² が同値なので平方根を省略する。
+            # シルエット係数がサンプリングせずに全件を使う規模なので距離行列も再利用する
+            squared_distances = _binary_euclidean_distances(X, squared=True)
+            dbscan = DBSCAN(
+                eps=eps * eps, min_samples=min_samples, metric="precomputed"
+            )
+            labels = dbscan.fit_predict(squared_distances)
+        elif self._binary_mode:
+            # それより大きい場合は n×n の距離行列を持たず、総当たりの近傍探索を
+            # working_memory 単位のチャンクで行う（0/1 データでは木構造の枝刈りが効かない）
+            dbscan = DBSCAN(
+                eps=eps, min_samples=min_samples, algorithm="brute", n_jobs=-1
+            )
+            labels = dbscan.fit_predict(X)
+        else:
+            # 既定の algorithm="auto" は低次元でも総当たりになりやすいため BallTree を明示
+            dbscan = DBSCAN(
+                eps=eps,
+                min_samples=min_samples,
+                algorithm="ball_tree",
+                leaf_size=kwargs.get("leaf_size", 30),
+                n_jobs=-1,
+            )
+            labels = dbscan.fit_predict(X)
 
         return {
             "labels": labels,
             "centers": None,
             "dendrogram_data": None,
+            "squared_distances": squared_distances,
         }
 
     def _calculate_evaluation_metrics(
-        self, df: pd.DataFrame, labels: np.ndarray
+        self,
+        X: np.ndarray,
+        labels: np.ndarray,
+        squared_distances: Optional[np.ndarray] = None,
+        counts: Optional[np.ndarray] = None,
     ) -> Dict[str, float]:
-        """評価指標の計算"""
+        """評価指標の計算（counts はノイズを除いたラベルごとの件数）"""
         metrics = {}
 
         try:
+            labels = np.asarray(labels)
+
             # ノイズポイント（-1ラベル）を除外
             valid_mask = labels != -1
-            if np.sum(valid_mask) < 2:
+            n_valid = np.count_nonzero(valid_mask)
+            if n_valid < 2:
                 return {"error": "有効なクラスターが不足しています"}
 
-            valid_data = df[valid_mask]
+            # 展開式 |a|²+|b|²-2a·b は桁落ちしやすいので評価指標だけは float64 で計算
+            X = np.ascontiguousarray(X[valid_mask], dtype=np.float64)
             valid_labels = labels[valid_mask]
-            n_clusters = len(np.unique(valid_labels))
+            if squared_distances is not None and n_valid < len(labels):
+                squared_distances = squared_distances[np.ix_(valid_mask, valid_mask)]
 
-            if n_clusters > 1:
-                # シルエット係数
-                metrics["silhouette_score"] = float(
-                    silhouette_score(valid_data, valid_labels)
-                )
-
-                # Calinski-Harabasz指標
-                metrics["calinski_harabasz_score"] = float(
-                    calinski_harabasz_score(valid_data, valid_labels)
-                )
+            # ラベルは 0 始まりの整数なので np.unique のソートではなく bincount 1パスで数える
+            if counts is None:
+                counts = np.bincount(valid_labels)
+            present = counts > 0
+            inverse = (np.cumsum(present) - 1)[valid_labels]
+            counts = counts[present]
+            n_clusters = len(counts)
 
-                # Davies-Bouldin指標
-                metrics["davies_bouldin_score"] = float(
-                    davies_bouldin_score(valid_data, valid_labels)
+            if n_clusters > 1:
+                if n_clusters >= len(X):
+                    raise ValueError(
+                        f"Number of labels is {n_clusters}. "
+                        f"Valid values are 2 to n_samples - 1 (inclusive)"
+                    )
+                metrics.update(
+                    self._compute_cluster_scores(
+                        X, inverse, counts, squared_distances=squared_distances
+                    )
                 )
 
             # ノイズ比率
-            metrics["noise_ratio"] = float(np.sum(labels == -1) / len(labels))
+            metrics["noise_ratio"] = float((len(labels) - n_valid) / len(labels))
 
         except Exception as e:
-            print(f"評価指標計算エラー: {e}")
+            logger.error("評価指標計算エラー: %s", e)
             metrics["error"] = str(e)
 
         return metrics
 
-    def _perform_pca(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _compute_cluster_scores(
+        self,
+        X: np.ndarray,
+        inverse: np.ndarray,
+        counts: np.ndarray,
+        sample_size: int = SILHOUETTE_SAMPLE_SIZE,
+        squared_distances: Optional[np.ndarray] = None,
+    ) -> Dict[str, float]:
+        """シルエット係数・CH指標・DB指標を行ノルムの2乗を共有してまとめて計算
+
+        重心ベースの CH指標・DB指標とシルエット係数は互いに独立なので、
+        サンプル数が多い場合はスレッドで並行に計算する（GEMM は GIL を解放する）。
+        """
+        n_samples = len(X)
+        sq_norms = np.einsum("ij,ij->i", X, X)
+        tasks = [
+            (self._centroid_scores, (X, inverse, counts, sq_norms)),
+            (
+                self._silhouette,
+                (X, inverse, len(counts), sq_norms, sample_size, squared_distances),
+            ),
+        ]
+        if n_samples >= PARALLEL_METRICS_MIN_SAMPLES:
+            results = Parallel(n_jobs=2, prefer="threads")(
+                delayed(fn)(*args) for fn, args in tasks
+            )
+        else:
+            results = [fn(*args) for fn, args in tasks]
+        (calinski_harabasz, davies_bouldin), (silhouette, m) = results
+
+        scores = {
+            "calinski_harabasz_score": calinski_harabasz,
+            "davies_bouldin_score": davies_bouldin,
+        }
+        if silhouette is None:
+            # サンプルに2つ以上のクラスターが含まれず、シルエット係数は定義されない
+            logger.debug("サンプル中のクラスターが1つのためシルエット係数を省略")
+        else:
+            scores["silhouette_score"] = silhouette
+        if silhouette is not None and m < n_samples:
+            # サンプリングによる近似値であることを結果に残す
+            scores["silhouette_sample_size"] = m
+            logger.debug("シルエット係数は %d/%d サンプルで近似", m, n_samples)
+        return scores
+
+    def _centroid_scores(
+        self,
+        X: np.ndarray,
+        inverse: np.ndarray,
+        counts: np.ndarray,
+        sq_norms: np.ndarray,
+    ):
+        """CH指標と DB指標（||x - c||² = ||x||² + ||c||² - 2x·c の展開で、
+        全サンプル×全重心の距離を GEMM 1回で求めて両方に使う）"""
+        n_samples, n_clusters = len(X), len(counts)
+        sample_index = np.arange(n_samples)
+
+        # クラスター和は疎な所属行列との積1回で求める（密な one-hot との GEMM と違い
+        # K に比例した無駄な積和がなく、(K, n) の密行列も確保しない）
+        membership = sparse.csr_matrix(
+            (np.ones(n_samples), (inverse, sample_index)),
+            shape=(n_clusters, n_samples),
+        )
+        cluster_sums = membership @ X
+        centroids = cluster_sums / counts[:, None]
+        centroid_sq_norms = np.einsum("ij,ij->i", centroids, centroids)
+
+        d2_to_centroids = (
+            sq_norms[:, None] + centroid_sq_norms[None, :] - 2.0 * (X @ centroids.T)
+        )
+        np.maximum(d2_to_centroids, 0.0, out=d2_to_centroids)
+        d2_own = d2_to_centroids[sample_index, inverse]
+
+        # Calinski-Harabasz指標
+        intra_disp = d2_own.sum()
+        overall_mean = cluster_sums.sum(axis=0) / n_samples
+        extra_disp = np.sum(counts * np.sum((centroids - overall_mean) ** 2, axis=1))
+        if intra_disp == 0:
+            calinski_harabasz = 1.0
+        else:
+            calinski_harabasz = (
+                extra_disp * (n_samples - n_clusters) / (intra_disp * (n_clusters - 1))
+            )
+
+        # Davies-Bouldin指標
+        intra_dists = (
+            np.bincount(inverse, weights=np.sqrt(d2_own), minlength=n_clusters)
+            / counts
+        )
+        centroid_d2 = (
+            centroid_sq_norms[:, None]
+            + centroid_sq_norms[None, :]
+            - 2.0 * (centroids @ centroids.T)
+        )
+        centroid_distances = np.sqrt(np.maximum(centroid_d2, 0.0))
+        np.fill_diagonal(centroid_distances, 0.0)
+        if np.allclose(intra_dists, 0) or np.allclose(centroid_distances, 0):
+            davies_bouldin = 0.0
+        else:
+            centroid_distances[centroid_distances == 0] = np.inf
+            combined_intra_dists = intra_dists[:, None] + intra_dists
+            davies_bouldin = np.mean(
+                np.max(combined_intra_dists / centroid_distances, axis=1)
+            )
+
+        return float(calinski_harabasz), float(davies_bouldin)
+
+    def _silhouette(
+        self,
+        X: np.ndarray,
+        inverse: np.ndarray,
+        n_clusters: int,
+        sq_norms: np.ndarray,
+        sample_size: int,
+        squared_distances: Optional[np.ndarray] = None,
+    ):
+        """シルエット係数と使用したサンプル数
+
+        squared_distances（サンプル間の距離の2乗）が渡された場合は距離行列を
+        再計算せずに切り出して使う。サンプルに含まれるクラスターが2つ未満なら
+        シルエット係数は None を返す。
+        """
+        n_samples = len(X)
+        sample_index = np.arange(n_samples)
+
+        # 大規模データはサンプリングして O(n²) を抑える
+        if n_samples > sample_size:
+            sample_index = np.random.RandomState(42).permutation(n_samples)[
+                :sample_size
+            ]
+        X_s = X[sample_index]
+        inverse_s = inverse[sample_index]
+        sq_s = sq_norms[sample_index]
+        m = len(X_s)
+        counts_s = np.bincount(inverse_s, minlength=n_clusters)
+        if np.count_nonzero(counts_s) < 2:
+            return None, m
+
+        if squared_distances is not None:
+            distances = np.sqrt(
+                squared_distances[np.ix_(sample_index, sample_index)]
+                if m < n_samples
+                else squared_distances
+            )
+        else:
+            distances = sq_s[:, None] + sq_s[None, :] - 2.0 * (X_s @ X_s.T)
+            np.maximum(distances, 0.0, out=distances)
+            np.sqrt(distances, out=distances)
+        np.fill_diagonal(distances, 0.0)
+
+        membership = np.zeros((m, n_clusters))
+        membership[np.arange(m), inverse_s] = 1.0
+        cluster_dist_sums = distances @ membership
+
+        own_counts = counts_s[inverse_s]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            intra = cluster_dist_sums[np.arange(m), inverse_s] / (own_counts - 1)
+            mean_dists = cluster_dist_sums / counts_s
+            # サンプルに1点もないクラスター（0/0 = NaN）は最近傍クラスターの候補から外す
+            mean_dists[:, counts_s == 0] = np.inf
+            mean_dists[np.arange(m), inverse_s] = np.inf
+            inter = mean_dists.min(axis=1)
+            silhouette = (inter - intra) / np.maximum(intra, inter)
+        silhouette = np.nan_to_num(silhouette)
+        silhouette[own_counts == 1] = 0.0
+
+        return float(np.mean(silhouette)), m
+
+    def _perform_pca(self, data: np.ndarray) -> Dict[str, Any]:
         """可視化用PCA"""
         try:
-            n_components = min(2, df.shape[1], df.shape[0] - 1)
-            pca = PCA(n_components=n_components)
-            coordinates = pca.fit_transform(df)
+            n_components = min(2, data.shape[1], data.shape[0] - 1)
+            # svd_solver="auto" はデータの大きさだけで乱択SVDを選び、乱数も固定
+            # されないため、特徴量数で明示的に切り替えて座標を再現可能にする
+            if data.shape[1] >= PCA_RANDOMIZED_MIN_FEATURES:
+                pca = PCA(
+                    n_components=n_components, svd_solver="randomized", random_state=42
+                )
+            else:
+                pca = PCA(n_components=n_components, svd_solver="full")
+            # orjson は C 連続の配列のみ直接シリアライズできる
+            coordinates = np.ascontiguousarray(pca.fit_transform(data))
 
             return {
                 "coordinates": coordinates,
                 "explained_variance_ratio": pca.explained_variance_ratio_.tolist(),
-                "components": pca.components_.tolist(),
+                "components": pca.components_,
+                "mean": pca.mean_,
             }
         except Exception as e:
-            print(f"PCA計算エラー: {e}")
+            logger.error("PCA計算エラー: %s", e)
             # フォールバック
             return {
                 "coordinates": (
-                    df.iloc[:, :2].values
-                    if df.shape[1] >= 2
-                    else np.column_stack([df.iloc[:, 0].values, np.zeros(len(df))])
+                    np.ascontiguousarray(data[:, :2])
+                    if data.shape[1] >= 2
+                    else np.column_stack([data[:, 0], np.zeros(len(data))])
                 ),
                 "explained_variance_ratio": [1.0, 0.0],
-                "components": [[1.0, 0.0], [0.0, 1.0]],
+                # 先頭2列をそのまま座標にしたので、射影も先頭2列の取り出しになる
+                "components": np.eye(2, data.shape[1]),
+                "mean": np.zeros(data.shape[1]),
             }
 
     def create_plot(self, results: Dict[str, Any], df: pd.DataFrame) -> str:
         """プロット作成 - シンプル版"""
         try:
-            print("=== プロット作成開始 ===")
+            logger.debug("=== プロット作成開始 ===")
+
+            cache_key = self._plot_cache_key(results, df)
+            with _plot_cache_lock:
+                cached = _plot_cache.get(cache_key)
+                if cached is not None:
+                    _plot_cache.move_to_end(cache_key)
+                    logger.debug("プロットキャッシュを使用")
+                    return cached
 
             # 日本語フォント設定
             self.setup_japanese_font()
 
             method = results["method"]
-            labels = np.array(results["labels"])
-            pca_coordinates = np.array(results["pca_coordinates"])
+            labels = np.asarray(results["labels"])
+            pca_coordinates = np.asarray(results["pca_coordinates"])
             explained_variance_ratio = results["pca_explained_variance_ratio"]
             n_clusters = results["n_clusters"]
 
-            # レイアウト設定
+            # レイアウト設定（pyplot のグローバルな図管理を通さず Figure を直接生成）
             if method == "hierarchical" and results.get("dendrogram_data") is not None:
                 # 階層クラスタリング（デンドログラム付き）
-                fig = plt.figure(figsize=(18, 12))
+                fig = Figure(figsize=(18, 12))
                 gs = fig.add_gridspec(
                     2, 3, height_ratios=[1, 1], width_ratios=[2, 1, 1]
                 )
@@ -366,7 +988,7 @@ class ClusterAnalyzer(BaseAnalyzer):
                 ax_metrics = fig.add_subplot(gs[:, 2])
             else:
                 # その他の手法
-                fig = plt.figure(figsize=(16, 10))
+                fig = Figure(figsize=(16, 10))
                 gs = fig.add_gridspec(2, 2, height_ratios=[2, 1])
                 ax_main = fig.add_subplot(gs[0, :])
                 ax_elbow = fig.add_subplot(gs[1, 0])
@@ -394,15 +1016,43 @@ class ClusterAnalyzer(BaseAnalyzer):
             if method == "hierarchical" and results.get("dendrogram_data") is not None:
                 self._create_dendrogram_plot(ax_dendro, results, df)
 
-            plt.tight_layout()
+            fig.tight_layout()
             plot_base64 = self.save_plot_as_base64(fig)
-            print("プロット作成完了")
+
+            with _plot_cache_lock:
+                _plot_cache[cache_key] = plot_base64
+                if len(_plot_cache) > PLOT_CACHE_SIZE:
+                    _plot_cache.popitem(last=False)
+
+            logger.debug("プロット作成完了")
             return plot_base64
 
         except Exception as e:
-            print(f"プロット作成エラー: {str(e)}")
+            logger.error("プロット作成エラー: %s", e)
             return self._create_fallback_plot(results, df)
 
+    def _plot_cache_key(self, results: Dict[str, Any], df: pd.DataFrame) -> bytes:
+        """プロットに影響する結果フィールドのハッシュ"""
+        key = blake2b(digest_size=16)
+        key.update(
+            repr(
+                (
+                    results["method"],
+                    results["n_clusters"],
+                    results["pca_explained_variance_ratio"],
+                    results.get("evaluation_metrics"),
+                    results.get("elbow_inertias"),
+                    df.index.tolist(),
+                )
+            ).encode()
+        )
+        key.update(np.asarray(results["labels"]).tobytes())
+        key.update(np.asarray(results["pca_coordinates"], dtype=np.float32).tobytes())
+        for field in ("cluster_centers", "dendrogram_data"):
+            if results.get(field) is not None:
+                key.update(np.asarray(results[field], dtype=np.float32).tobytes())
+        return key.digest()
+
     def _create_cluster_plot(
         self, ax, coordinates, labels, explained_variance_ratio, method, results
     ):
@@ -410,45 +1060,47 @@ class ClusterAnalyzer(BaseAnalyzer):
         try:
             ax.set_facecolor("white")
 
-            unique_labels = np.unique(labels)
-            colors = plt.cm.Set3(np.linspace(0, 1, len(unique_labels)))
+            unique_labels, label_index = self._label_index(
+                labels, results.get("cluster_sizes")
+            )
+            colors = _set3_lut(len(unique_labels))
+
+            # クラスターごとに単色の scatter で描画（単色のコレクションは Agg が
+            # マーカーを1度だけラスタライズして使い回すため、点ごとに色を持つ
+            # 1つのコレクションより大規模データで速い）
+            groups = self._rows_by_label(label_index, len(unique_labels))
+            for i, (label, rows) in enumerate(zip(unique_labels, groups)):
+                if label == -1:
+                    continue
+                ax.scatter(
+                    coordinates[rows, 0],
+                    coordinates[rows, 1],
+                    c=[colors[i]],
+                    s=100,
+                    alpha=0.7,
+                    edgecolor="white",
+                    linewidth=0.5,
+                    label=f"クラスター {label + 1}",
+                )
+
+            noise_mask = labels == -1
 
-            # クラスターごとにプロット
-            for i, label in enumerate(unique_labels):
-                mask = labels == label
-                if label == -1:  # ノイズポイント（DBSCAN）
-                    ax.scatter(
-                        coordinates[mask, 0],
-                        coordinates[mask, 1],
-                        c="black",
-                        marker="x",
-                        s=80,
-                        alpha=0.8,
-                        label="ノイズ",
-                    )
-                else:
-                    ax.scatter(
-                        coordinates[mask, 0],
-                        coordinates[mask, 1],
-                        c=[colors[i]],
-                        s=100,
-                        alpha=0.7,
-                        edgecolor="white",
-                        linewidth=0.5,
-                        label=f"クラスター {label + 1}",
-                    )
+            # ノイズポイント（DBSCAN）
+            if noise_mask.any():
+                ax.scatter(
+                    coordinates[noise_mask, 0],
+                    coordinates[noise_mask, 1],
+                    c="black",
+                    marker="x",
+                    s=80,
+                    alpha=0.8,
+                    label="ノイズ",
+                )
 
             # クラスター中心点（K-meansの場合）
-            if method == "kmeans" and results.get("cluster_centers"):
+            if method == "kmeans" and results.get("cluster_centers") is not None:
                 try:
-                    # PCA変換した中心点の近似
-                    from sklearn.decomposition import PCA
-
-                    centers = np.array(results["cluster_centers"])
-                    pca = PCA(n_components=2)
-                    # 元データで学習済みのPCAを使うべきだが、簡易版として再計算
-                    pca.fit(centers)
-                    centers_2d = pca.transform(centers)
+                    centers_2d = self._project_centers(results)
 
                     ax.scatter(
                         centers_2d[:, 0],
@@ -514,41 +1166,89 @@ class ClusterAnalyzer(BaseAnalyzer):
                 )
 
         except Exception as e:
-            print(f"クラスター分布図エラー: {e}")
+            logger.error("クラスター分布図エラー: %s", e)
+
+    def _label_index(self, labels: np.ndarray, cluster_sizes=None):
+        """np.unique(labels, return_inverse=True) と同じ結果をソートせずに求める
+
+        analyze で数えたクラスターごとの件数（ノイズ除く）があれば、出現する
+        ラベルとその順位は件数から決まるのでラベル配列の走査は1回で済む。
+        """
+        if cluster_sizes is None:
+            return np.unique(labels, return_inverse=True)
+
+        sizes = np.asarray(cluster_sizes)
+        present = sizes > 0
+        has_noise = bool((labels == -1).any())
+        # ノイズ（-1）は先頭なので、クラスターの順位はノイズの有無だけずれる
+        rank = np.r_[np.cumsum(present) - 1 + has_noise, 0]
+        label_index = rank[labels]  # -1 は末尾の 0（ノイズの順位）を参照
+        unique_labels = np.flatnonzero(present)
+        if has_noise:
+            unique_labels = np.r_[-1, unique_labels]
+        return unique_labels, label_index
+
+    def _rows_by_label(self, label_index: np.ndarray, n_labels: int) -> List[np.ndarray]:
+        """ラベルの順位（0..n_labels-1）ごとの行番号（マスク走査ではなくソート1回で分割）"""
+        order = np.argsort(label_index, kind="stable")
+        boundaries = np.searchsorted(label_index[order], np.arange(1, n_labels))
+        return np.split(order, boundaries)
+
+    def _project_centers(self, results: Dict[str, Any]) -> np.ndarray:
+        """K-means の中心点を観測点と同じ可視化用 PCA 空間に射影（2列）
+
+        中心点は前処理済みデータの空間にあるので、analyze で学習した PCA の
+        平均と主成分をそのまま使う（PCA を学習し直さない）。
+        """
+        centers = np.asarray(results["cluster_centers"], dtype=np.float64)
+        components = np.asarray(results["pca_components"], dtype=np.float64)
+        projected = (centers - results["pca_mean"]) @ components.T
+        if projected.shape[1] < 2:
+            projected = np.column_stack(
+                [projected, np.zeros((len(projected), 2 - projected.shape[1]))]
+            )
+        return projected[:, :2]
 
     def _create_elbow_plot(self, ax, df, results):
         """エルボー法プロット"""
         try:
             ax.set_facecolor("white")
 
-            # K=2から10までの慣性を計算
-            numeric_df = df.select_dtypes(include=[np.number])
-            if numeric_df.empty:
+            if not self._elbow_applicable(results.get("method"), len(df)):
                 ax.text(
                     0.5,
                     0.5,
-                    "数値データが不足",
+                    "エルボー法は適用外",
                     ha="center",
                     va="center",
                     transform=ax.transAxes,
+                    fontsize=12,
                 )
                 ax.set_title("エルボー法", fontsize=14, fontweight="bold")
                 return
 
-            scaler = StandardScaler()
-            scaled_data = scaler.fit_transform(numeric_df)
+            # K=2から10までの慣性（analyze で計算済みならそれを使う）
+            inertias = results.get("elbow_inertias")
+            if inertias is None:
+                numeric_df = df.select_dtypes(include=[np.number])
+                if numeric_df.empty:
+                    ax.text(
+                        0.5,
+                        0.5,
+                        "数値データが不足",
+                        ha="center",
+                        va="center",
+                        transform=ax.transAxes,
+                    )
+                    ax.set_title("エルボー法", fontsize=14, fontweight="bold")
+                    return
 
-            max_k = min(10, len(df) - 1)
-            k_range = range(2, max_k + 1)
-            inertias = []
+                scaled_data = StandardScaler().fit_transform(numeric_df)
+                inertias = self._compute_inertias(
+                    scaled_data, range(2, min(10, len(df) - 1) + 1)
+                )
 
-            for k in k_range:
-                try:
-                    kmeans = KMeans(n_clusters=k, random_state=42, n_init=10)
-                    kmeans.fit(scaled_data)
-                    inertias.append(kmeans.inertia_)
-                except:
-                    inertias.append(0)
+            k_range = range(2, len(inertias) + 2)
 
             if inertias:
                 ax.plot(k_range, inertias, "bo-", linewidth=2, markersize=8)
@@ -572,7 +1272,7 @@ class ClusterAnalyzer(BaseAnalyzer):
                 ax.grid(True, linestyle=":", alpha=0.6)
 
         except Exception as e:
-            print(f"エルボー法プロットエラー: {e}")
+            logger.error("エルボー法プロットエラー: %s", e)
             ax.text(
                 0.5,
                 0.5,
@@ -583,6 +1283,61 @@ class ClusterAnalyzer(BaseAnalyzer):
                 fontsize=12,
             )
 
+    def _elbow_applicable(self, method: Optional[str], n_samples: int) -> bool:
+        """エルボー法が意味を持つか（K-means かつ K を掃引できるだけのサンプル数）"""
+        return method == "kmeans" and n_samples >= ELBOW_MIN_SAMPLES
+
+    def _compute_inertias(
+        self, scaled_data: np.ndarray, k_range: range
+    ) -> List[float]:
+        """エルボー法用に各Kの慣性を計算
+
+        numba があり中規模以下のデータなら K ごとの Lloyd 法を JIT カーネルで
+        並列に回し、それ以外は MiniBatchKMeans で距離計算を減らす。
+        JIT カーネルの初期化の試行回数は K-means 本体と同じにして、
+        エルボー曲線が sklearn の KMeans の慣性と揃うようにする。
+        精度は単精度で十分なので float32 に揃えてメモリ転送量を半分にする。
+        """
+        scaled_data = np.ascontiguousarray(scaled_data, dtype=np.float32)
+        n_samples, n_features = scaled_data.shape
+
+        if (
+            NUMBA_AVAILABLE
+            and len(k_range) > 0
+            and len(scaled_data) <= ELBOW_JIT_MAX_SAMPLES
+        ):
+            try:
+                ks = np.asarray(k_range, dtype=np.int64)
+                n_inits = np.array(
+                    [kmeans_n_init(n_samples, k, n_features, 10) for k in k_range],
+                    dtype=np.int64,
+                )
+                return _elbow_inertias(scaled_data, ks, n_inits, 42).tolist()
+            except Exception as e:
+                logger.warning("numba エルボー計算エラー、MiniBatchKMeans を使用: %s", e)
+
+        batch_size = min(1024, n_samples)
+
+        def fit_inertia(k):
+            try:
+                kmeans = MiniBatchKMeans(
+                    n_clusters=k,
+                    batch_size=batch_size,
+                    n_init=kmeans_n_init(n_samples, k, n_features, 3),
+                    random_state=42,
+                )
+                return float(kmeans.fit(scaled_data).inertia_)
+            except Exception:
+                return 0.0
+
+        return self._sweep(k_range, fit_inertia)
+
+    def _sweep(self, param_grid, fitter) -> List[Any]:
+        """パラメータ掃引を並列実行（各点は独立、sklearnはGILを解放するためスレッドで十分）"""
+        return Parallel(n_jobs=-1, prefer="threads")(
+            delayed(fitter)(param) for param in param_grid
+        )
+
     def _create_metrics_plot(self, ax, results):
         """評価指標プロット"""
         try:
@@ -605,10 +1360,12 @@ class ClusterAnalyzer(BaseAnalyzer):
             metrics_data = []
             metric_names = []
             colors_list = []
+            original_values = []
 
             if "silhouette_score" in evaluation_metrics:
                 score = evaluation_metrics["silhouette_score"]
                 metrics_data.append(score)
+                original_values.append(score)
                 metric_names.append("シルエット係数")
                 colors_list.append("skyblue" if score >= 0.5 else "lightcoral")
 
@@ -617,6 +1374,7 @@ class ClusterAnalyzer(BaseAnalyzer):
                 score = evaluation_metrics["calinski_harabasz_score"]
                 normalized_score = min(1.0, score / 100)
                 metrics_data.append(normalized_score)
+                original_values.append(score)
                 metric_names.append("CH指標\n(正規化)")
                 colors_list.append("lightgreen" if score >= 10 else "lightcoral")
 
@@ -625,6 +1383,7 @@ class ClusterAnalyzer(BaseAnalyzer):
                 score = evaluation_metrics["davies_bouldin_score"]
                 normalized_score = 1 / (1 + score)
                 metrics_data.append(normalized_score)
+                original_values.append(score)
                 metric_names.append("DB指標\n(逆数正規化)")
                 colors_list.append("lightgreen" if score <= 1.0 else "lightcoral")
 
@@ -637,25 +1396,9 @@ class ClusterAnalyzer(BaseAnalyzer):
                     edgecolor="black",
                 )
 
-                # 元の値をバーの上に表示
-                original_values = [
-                    evaluation_metrics.get("silhouette_score", 0),
-                    evaluation_metrics.get("calinski_harabasz_score", 0),
-                    evaluation_metrics.get("davies_bouldin_score", 0),
-                ]
-
-                for bar, name, orig_val in zip(
-                    bars, metric_names, original_values[: len(bars)]
-                ):
-                    height = bar.get_height()
-                    ax.text(
-                        bar.get_x() + bar.get_width() / 2.0,
-                        height + 0.01,
-                        f"{orig_val:.3f}",
-                        ha="center",
-                        va="bottom",
-                        fontsize=9,
-                    )
+                # 元の値をバーの上に表示（書式化は np.char.mod でまとめて行う）
+                value_labels = np.char.mod("%.3f", np.asarray(original_values))
+                ax.bar_label(bars, labels=value_labels.tolist(), padding=3, fontsize=9)
 
             ax.set_title("クラスター評価指標", fontsize=14, fontweight="bold")
             ax.set_ylabel("正規化スコア", fontsize=12)
@@ -663,7 +1406,7 @@ class ClusterAnalyzer(BaseAnalyzer):
             ax.grid(True, linestyle=":", alpha=0.3)
 
         except Exception as e:
-            print(f"評価指標プロットエラー: {e}")
+            logger.error("評価指標プロットエラー: %s", e)
 
     def _create_dendrogram_plot(self, ax, results, df):
         """デンドログラムプロット - 改善版"""
@@ -671,8 +1414,8 @@ class ClusterAnalyzer(BaseAnalyzer):
             ax.set_facecolor("white")
             dendrogram_data = results.get("dendrogram_data")
 
-            print(
-                f"デンドログラムプロット作成: データ有無={dendrogram_data is not None}"
+            logger.debug(
+                "デンドログラムプロット作成: データ有無=%s", dendrogram_data is not None
             )
 
             if dendrogram_data is None:
@@ -681,17 +1424,16 @@ class ClusterAnalyzer(BaseAnalyzer):
                 return
 
             try:
-                from scipy.cluster.hierarchy import dendrogram
-                import numpy as np
-
                 # データの妥当性再チェック
                 if not isinstance(dendrogram_data, np.ndarray):
-                    print("デンドログラムデータが配列ではありません")
+                    logger.debug("デンドログラムデータが配列ではありません")
                     self._create_dendrogram_alternative(ax, results, df)
                     return
 
                 if dendrogram_data.shape[1] != 4:
-                    print(f"デンドログラムデータの形状が不正: {dendrogram_data.shape}")
+                    logger.debug(
+                        "デンドログラムデータの形状が不正: %s", dendrogram_data.shape
+                    )
                     self._create_dendrogram_alternative(ax, results, df)
                     return
 
@@ -700,40 +1442,39 @@ class ClusterAnalyzer(BaseAnalyzer):
                 max_display_labels = 20  # 表示ラベル数を制限
 
                 if n_samples <= max_display_labels:
+                    # scipy の dendrogram は float64 のリンケージ行列しか受け付けない
+                    linkage_to_draw = dendrogram_data.astype(np.float64)
                     labels = [str(idx) for idx in df.index[:max_display_labels]]
-                    truncate_mode = None
-                    p_param = None
                 else:
-                    labels = None  # ラベルなしで描画
-                    truncate_mode = "lastp"
-                    p_param = max_display_labels
+                    # 上位の併合だけに切り詰めてから描画（lastp 表示と同じ見た目）
+                    linkage_to_draw, labels = _truncate_linkage(
+                        dendrogram_data, max_display_labels
+                    )
 
-                print(
-                    f"デンドログラム描画準備: samples={n_samples}, labels={len(labels) if labels else 0}, truncate={truncate_mode}"
+                logger.debug(
+                    "デンドログラム描画準備: samples=%d, labels=%d, truncated=%s",
+                    n_samples,
+                    len(labels),
+                    n_samples > max_display_labels,
                 )
 
                 # デンドログラム描画パラメータ
                 dend_params = {
-                    "Z": dendrogram_data,
+                    "Z": linkage_to_draw,
                     "ax": ax,
+                    "labels": labels,
                     "leaf_rotation": 90,
-                    "leaf_font_size": 8 if labels else 10,
+                    "leaf_font_size": 8 if n_samples <= max_display_labels else 10,
                     "color_threshold": 0.7 * np.max(dendrogram_data[:, 2]),
                     "above_threshold_color": "lightgray",
                 }
 
-                if labels:
-                    dend_params["labels"] = labels
-                if truncate_mode:
-                    dend_params["truncate_mode"] = truncate_mode
-                    dend_params["p"] = p_param
-
-                print("デンドログラム描画実行中...")
+                logger.debug("デンドログラム描画実行中...")
 
                 # 実際に描画
                 dend = dendrogram(**dend_params)
 
-                print("✅ デンドログラム描画完了")
+                logger.debug("✅ デンドログラム描画完了")
 
                 # タイトルと軸ラベル
                 ax.set_title("デンドログラム（樹形図）", fontsize=14, fontweight="bold")
@@ -774,32 +1515,33 @@ class ClusterAnalyzer(BaseAnalyzer):
                 )
 
             except Exception as plot_error:
-                print(f"デンドログラム描画エラー: {plot_error}")
-                import traceback
-
-                print(f"描画エラー詳細:\n{traceback.format_exc()}")
+                logger.error("デンドログラム描画エラー: %s", plot_error)
+                logger.debug("描画エラー詳細", exc_info=True)
                 self._create_dendrogram_alternative(ax, results, df)
 
         except Exception as e:
-            print(f"デンドログラム全体エラー: {e}")
+            logger.error("デンドログラム全体エラー: %s", e)
             self._create_dendrogram_alternative(ax, results, df)
 
     def _create_fallback_plot(self, results: Dict[str, Any], df: pd.DataFrame) -> str:
         """フォールバック用シンプルプロット"""
         try:
-            fig, ax = plt.subplots(figsize=(10, 8))
+            fig = Figure(figsize=(10, 8))
+            ax = fig.subplots()
             fig.patch.set_facecolor("white")
 
-            labels = np.array(results["labels"])
-            pca_coordinates = np.array(results["pca_coordinates"])
-            unique_labels = np.unique(labels)
-            colors = plt.cm.Set3(np.linspace(0, 1, len(unique_labels)))
+            labels = np.asarray(results["labels"])
+            pca_coordinates = np.asarray(results["pca_coordinates"])
+            unique_labels, label_index = self._label_index(
+                labels, results.get("cluster_sizes")
+            )
+            colors = _set3_lut(len(unique_labels))
 
-            for i, label in enumerate(unique_labels):
-                mask = labels == label
+            groups = self._rows_by_label(label_index, len(unique_labels))
+            for i, (label, rows) in enumerate(zip(unique_labels, groups)):
                 ax.scatter(
-                    pca_coordinates[mask, 0],
-                    pca_coordinates[mask, 1],
+                    pca_coordinates[rows, 0],
+                    pca_coordinates[rows, 1],
                     c=[colors[i]],
                     label=f"クラスター {label + 1}",
                     alpha=0.7,
@@ -811,70 +1553,85 @@ class ClusterAnalyzer(BaseAnalyzer):
             ax.legend()
             ax.grid(True, alpha=0.3)
 
-            plt.tight_layout()
+            fig.tight_layout()
             return self.save_plot_as_base64(fig)
 
         except Exception as e:
-            print(f"フォールバックプロットエラー: {e}")
+            logger.error("フォールバックプロットエラー: %s", e)
             return ""
 
-    def _save_cluster_coordinates(
+    def _coordinate_columns(self, pca_coordinates):
+        """PCA座標の第1・第2次元を Python の float リストとして取り出す
+
+        結果がリストで渡されても一度だけ C 連続の float64 配列に変換し、
+        列ごとに .tolist() することで要素ごとの NumPy スカラー変換を避ける。
+        同じ配列に対する2回目以降の呼び出しは変換結果を再利用する。
+        """
+        cache = self._coordinate_cache
+        if cache is not None and cache[0] is pca_coordinates:
+            return cache[1]
+
+        coords = np.ascontiguousarray(pca_coordinates, dtype=np.float64)
+        zeros = np.zeros(len(coords))
+        dim1 = coords[:, 0] if coords.shape[1] > 0 else zeros
+        dim2 = coords[:, 1] if coords.shape[1] > 1 else zeros
+        columns = (dim1.tolist(), dim2.tolist())
+        self._coordinate_cache = (pca_coordinates, columns)
+        return columns
+
+    def _save_coordinates_data(
         self, db, session_id: int, df: pd.DataFrame, results: Dict[str, Any]
     ):
         """クラスター解析の座標データ保存（ClusterAnalyzerクラス内）"""
         try:
             from models import CoordinatesData
-            import numpy as np
 
             pca_coordinates = results.get("pca_coordinates")
             labels = results.get("labels")
-            sample_names = results.get("sample_names", df.index.tolist())
+            sample_names = results.get("sample_names") or df.index.astype(str).tolist()
 
-            print(
-                f"座標データ保存開始: pca_coordinates={pca_coordinates is not None}, labels={labels is not None}"
+            logger.debug(
+                "座標データ保存開始: pca_coordinates=%s, labels=%s",
+                pca_coordinates is not None,
+                labels is not None,
             )
-            print(f"sample_names数: {len(sample_names) if sample_names else 0}")
+            logger.debug("sample_names数: %d", len(sample_names))
 
             if pca_coordinates is not None and labels is not None:
-                print(
-                    f"PCA座標形状: {np.array(pca_coordinates).shape if pca_coordinates is not None else 'None'}"
-                )
-                print(f"ラベル数: {len(labels) if labels else 0}")
-
-                pca_array = np.array(pca_coordinates)
-                labels_array = np.array(labels)
-
-                for i, name in enumerate(sample_names):
-                    if i < len(pca_array) and i < len(labels_array):
-                        # クラスターラベルを含む観測値として保存
-                        cluster_label = (
-                            int(labels_array[i]) + 1 if labels_array[i] != -1 else -1
-                        )
-
-                        coord_data = CoordinatesData(
-                            session_id=session_id,
-                            point_name=str(name),
-                            point_type="observation",
-                            dimension_1=(
-                                float(pca_array[i, 0])
-                                if pca_array.shape[1] > 0
-                                else 0.0
-                            ),
-                            dimension_2=(
-                                float(pca_array[i, 1])
-                                if pca_array.shape[1] > 1
-                                else 0.0
-                            ),
-                        )
-                        db.add(coord_data)
+                labels_array = np.asarray(labels)
+                dim1, dim2 = self._coordinate_columns(pca_coordinates)
+                logger.debug("PCA座標数: %d", len(dim1))
+                logger.debug("ラベル数: %d", len(labels_array))
+
+                n_rows = min(len(sample_names), len(dim1), len(labels_array))
+
+                # 行ごとの db.add ではなく、マッピングのリストを一括 INSERT する
+                rows = [
+                    {
+                        "session_id": session_id,
+                        "point_name": name,
+                        "point_type": "observation",
+                        "dimension_1": x,
+                        "dimension_2": y,
+                    }
+                    for name, x, y in zip(sample_names[:n_rows], dim1, dim2)
+                ]
+                db.bulk_insert_mappings(CoordinatesData, rows)
 
-                        if i < 3:  # 最初の3つをログ出力
-                            print(
-                                f"座標データ{i+1}: name={name}, cluster={cluster_label}, "
-                                f"dim1={coord_data.dimension_1:.3f}, dim2={coord_data.dimension_2:.3f}"
-                            )
+                cluster_numbers = np.where(
+                    labels_array[:n_rows] == -1, -1, labels_array[:n_rows] + 1
+                )
+                for i, row in enumerate(rows[:3]):  # 最初の3つをログ出力
+                    logger.debug(
+                        "座標データ%d: name=%s, cluster=%d, dim1=%.3f, dim2=%.3f",
+                        i + 1,
+                        row["point_name"],
+                        cluster_numbers[i],
+                        row["dimension_1"],
+                        row["dimension_2"],
+                    )
 
-                print(f"座標データ保存完了: {len(sample_names)}件")
+                logger.debug("座標データ保存完了: %d件", len(rows))
 
             # クラスター中心点の保存（K-meansの場合）
             if (
@@ -882,43 +1639,35 @@ class ClusterAnalyzer(BaseAnalyzer):
                 and results.get("cluster_centers") is not None
             ):
                 cluster_centers = results.get("cluster_centers")
-                print(f"クラスター中心点保存: {len(cluster_centers)}個")
+                logger.debug("クラスター中心点保存: %d個", len(cluster_centers))
 
                 # PCA変換された中心点を計算
                 if pca_coordinates is not None and cluster_centers is not None:
                     try:
-                        from sklearn.decomposition import PCA
-
-                        # 元のデータでPCAを学習
-                        pca = PCA(n_components=2)
-                        pca.fit(df.select_dtypes(include=[np.number]))
-
-                        # 中心点をPCA空間に変換
-                        centers_2d = pca.transform(np.array(cluster_centers))
-
-                        for i, center_2d in enumerate(centers_2d):
-                            coord_data = CoordinatesData(
-                                session_id=session_id,
-                                point_name=f"クラスター{i+1}中心",
-                                point_type="center",
-                                dimension_1=float(center_2d[0]),
-                                dimension_2=float(center_2d[1]),
-                            )
-                            db.add(coord_data)
-                            print(
-                                f"中心点{i+1}: dim1={center_2d[0]:.3f}, dim2={center_2d[1]:.3f}"
-                            )
+                        centers_2d = self._project_centers(results)
+
+                        db.bulk_insert_mappings(
+                            CoordinatesData,
+                            [
+                                {
+                                    "session_id": session_id,
+                                    "point_name": f"クラスター{i+1}中心",
+                                    "point_type": "center",
+                                    "dimension_1": x,
+                                    "dimension_2": y,
+                                }
+                                for i, (x, y) in enumerate(centers_2d.tolist())
+                            ],
+                        )
 
-                        print(f"クラスター中心点保存完了: {len(centers_2d)}件")
+                        logger.debug("クラスター中心点保存完了: %d件", len(centers_2d))
 
                     except Exception as center_error:
-                        print(f"クラスター中心点PCA変換エラー: {center_error}")
+                        logger.error("クラスター中心点PCA変換エラー: %s", center_error)
 
         except Exception as e:
-            print(f"クラスター座標データ保存エラー: {e}")
-            import traceback
-
-            print(f"詳細:\n{traceback.format_exc()}")
+            logger.error("クラスター座標データ保存エラー: %s", e)
+            logger.debug("詳細", exc_info=True)
 
     def create_response(
         self,
@@ -931,10 +1680,12 @@ class ClusterAnalyzer(BaseAnalyzer):
     ) -> Dict[str, Any]:
         """レスポンスデータを作成"""
         try:
-            pca_coordinates = results["pca_coordinates"]
-            labels = results["labels"]
+            labels = np.asarray(results["labels"])
             sample_names = results["sample_names"]
 
+            dim1, dim2 = self._coordinate_columns(results["pca_coordinates"])
+            clusters = np.where(labels == -1, -1, labels + 1).tolist()
+
             return {
                 "success": True,
                 "session_id": session_id,
@@ -956,14 +1707,14 @@ class ClusterAnalyzer(BaseAnalyzer):
                     "coordinates": {
                         "observations": [
                             {
-                                "name": str(sample_names[i]),
-                                "cluster": (
-                                    int(labels[i]) + 1 if labels[i] != -1 else -1
-                                ),
-                                "dimension_1": float(pca_coordinates[i, 0]),
-                                "dimension_2": float(pca_coordinates[i, 1]),
+                                "name": name,
+                                "cluster": cluster,
+                                "dimension_1": x,
+                                "dimension_2": y,
                             }
-                            for i in range(len(sample_names))
+                            for name, cluster, x, y in zip(
+                                sample_names, clusters, dim1, dim2
+                            )
                         ]
                     },
                 },
@@ -972,11 +1723,11 @@ class ClusterAnalyzer(BaseAnalyzer):
                     "filename": file.filename,
                     "rows": df.shape[0],
                     "columns": df.shape[1],
-                    "row_names": [str(x) for x in df.index],
-                    "column_names": [str(x) for x in df.columns],
+                    "row_names": df.index.astype(str).tolist(),
+                    "column_names": df.columns.astype(str).tolist(),
                     "method": results["method"],
                 },
             }
         except Exception as e:
-            print(f"レスポンス作成エラー: {e}")
+            logger.error("レスポンス作成エラー: %s", e)
             raise
@@ -1,13 +1,94 @@
 # python-api/analysis/correspondence.py
 from typing import Dict, Any
+import logging
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
 import matplotlib.patheffects as pe
-from scipy.stats import chi2_contingency
-from scipy.spatial.distance import pdist, squareform
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+from scipy.linalg import svd
+from scipy.sparse.linalg import svds
+from scipy.stats import chi2, chi2_contingency
 from .base import BaseAnalyzer
 
+logger = logging.getLogger(__name__)
+
+# ラベル位置の調整量（最近傍距離の中央値に対する倍率、近隣点1つあたりの拡大率、
+# 拡大率の上限）
+LABEL_BASE_OFFSET_RATIO = 0.3
+LABEL_DENSITY_RATIO = 0.15
+LABEL_DENSITY_CAP = 2.0
+
+# 残差行列の短い辺がこれを超え、求める次元数がその 1/TRUNCATED_SVD_RANK_RATIO
+# 未満なら、使う成分だけを ARPACK の部分特異値分解で求める
+# （小さな表では ARPACK の反復のオーバーヘッドの方が大きい）
+TRUNCATED_SVD_MIN_DIM = 150
+TRUNCATED_SVD_RANK_RATIO = 4
+
+# 必須でないライブラリは条件付きインポート
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    logger.warning("numba not available, using NumPy label placement only")
+
+    def njit(*args, **kwargs):
+        """numba 未導入時のダミー（JIT 対象の関数は呼び出されない）"""
+        return lambda func: func
+
+
+@njit(cache=True, boundscheck=False)
+def _nearest_label_distances(coords: np.ndarray) -> np.ndarray:
+    """各点から最も近い他の点までの距離（距離行列を作らずに1パスで求める）"""
+    n = coords.shape[0]
+    nearest = np.full(n, np.inf)
+    for i in range(n):
+        for j in range(i + 1, n):
+            dx = coords[i, 0] - coords[j, 0]
+            dy = coords[i, 1] - coords[j, 1]
+            d = np.sqrt(dx * dx + dy * dy)
+            if d < nearest[i]:
+                nearest[i] = d
+            if d < nearest[j]:
+                nearest[j] = d
+    return nearest
+
+
+@njit(cache=True, boundscheck=False)
+def _label_offsets(
+    coords: np.ndarray,
+    avg_distance: float,
+    base_offset: float,
+    density_ratio: float,
+    density_cap: float,
+) -> np.ndarray:
+    """近隣点の数と原点からの角度に応じたラベルのオフセット (n, 2)"""
+    n = coords.shape[0]
+    offsets = np.zeros((n, 2))
+    for i in range(n):
+        neighbors = 0
+        for j in range(n):
+            if j == i:
+                continue
+            dx = coords[i, 0] - coords[j, 0]
+            dy = coords[i, 1] - coords[j, 1]
+            if np.sqrt(dx * dx + dy * dy) < avg_distance:
+                neighbors += 1
+        offset = base_offset * min(1.0 + neighbors * density_ratio, density_cap)
+
+        angle = np.arctan2(coords[i, 1], coords[i, 0])
+        if abs(angle) <= np.pi / 4:
+            offsets[i, 0] = offset
+        elif abs(angle) >= 3 * np.pi / 4:
+            offsets[i, 0] = -offset
+        elif angle > 0:
+            offsets[i, 1] = offset
+        else:
+            offsets[i, 1] = -offset
+    return offsets
+
 
 class CorrespondenceAnalyzer(BaseAnalyzer):
     """コレスポンデンス分析クラス"""
@@ -20,25 +101,21 @@ class CorrespondenceAnalyzer(BaseAnalyzer):
     ) -> Dict[str, Any]:
         """コレスポンデンス分析を実行"""
         try:
-            print(f"=== 分析開始 ===")
-            print(f"入力データ:\n{df}")
-            print(f"データ形状: {df.shape}")
+            logger.debug("=== 分析開始 ===")
+            logger.debug("データ形状: %s", df.shape)
 
             # データの検証と前処理
             df_processed = self._preprocess_correspondence_data(df)
-            print(f"前処理後データ:\n{df_processed}")
+            logger.debug("前処理後データ形状: %s", df_processed.shape)
 
             # コレスポンデンス分析の計算
             results = self._compute_correspondence_analysis(df_processed, n_components)
 
-            print(f"分析結果: {list(results.keys())}")
+            logger.debug("分析結果: %s", list(results))
             return results
 
         except Exception as e:
-            print(f"分析エラー: {str(e)}")
-            import traceback
-
-            print(f"トレースバック:\n{traceback.format_exc()}")
+            logger.error("分析エラー: %s", e)
             raise
 
     def _preprocess_correspondence_data(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -52,7 +129,7 @@ class CorrespondenceAnalyzer(BaseAnalyzer):
         df_clean = df_clean[row_sums > 0]
         df_clean = df_clean.loc[:, col_sums > 0]
 
-        print(f"前処理: {df.shape} -> {df_clean.shape}")
+        logger.debug("前処理: %s -> %s", df.shape, df_clean.shape)
 
         if df_clean.empty or df_clean.shape[0] < 2 or df_clean.shape[1] < 2:
             raise ValueError("有効なデータが不足しています（最低2×2のデータが必要）")
@@ -64,47 +141,78 @@ class CorrespondenceAnalyzer(BaseAnalyzer):
     ) -> Dict[str, Any]:
         """コレスポンデンス分析の計算"""
         try:
+            # 分割表は一度だけ float64 の配列にし、以降の集計・演算は配列で行う
+            # （行名・列名は df 側に残してラベル付けにのみ使う）
+            A = np.asarray(df.to_numpy(dtype=np.float64), order="C")
+            n_rows, n_cols = A.shape
+
             # 基本統計
-            N = df.sum().sum()  # 総計
-            row_totals = df.sum(axis=1)
-            col_totals = df.sum(axis=0)
+            N = A.sum()  # 総計
+            row_totals = A.sum(axis=1)
+            col_totals = A.sum(axis=0)
 
-            print(f"総計: {N}")
-            print(f"行合計: {row_totals.to_dict()}")
-            print(f"列合計: {col_totals.to_dict()}")
+            logger.debug("総計: %s", N)
 
             # 相対度数表
-            P = df / N
+            P = A / N
             r = row_totals / N  # 行周辺度数
             c = col_totals / N  # 列周辺度数
 
-            # 期待度数行列
-            E = np.outer(r, c)
-
-            # 標準化残差行列
-            residuals = (P - E) / np.sqrt(E)
-            residuals = np.nan_to_num(residuals, 0)  # NaNを0に置換
-
-            print(f"残差行列:\n{residuals}")
-
-            # 特異値分解
-            U, sigma, Vt = np.linalg.svd(residuals, full_matrices=False)
+            # 期待度数の平方根 √E = √r √cᵀ（期待度数行列 E 自体は作らない）
+            sqrt_expected = np.outer(np.sqrt(r), np.sqrt(c))
+
+            # 標準化残差行列 (P - E) / √E = P / √E - √E
+            # （LAPACK がコピーせずに使える列優先の配列に直接書き込む）
+            residuals = np.divide(P, sqrt_expected, order="F")
+            residuals -= sqrt_expected
+            residuals = np.nan_to_num(residuals, copy=False)  # NaNを0に置換
+
+            # 大きな表では配列の文字列化自体が重いので、DEBUG 時のみ触れる
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("残差行列:\n%s", residuals)
+
+            n_short = min(n_rows, n_cols)
+            if (
+                n_short > TRUNCATED_SVD_MIN_DIM
+                and n_components < n_short // TRUNCATED_SVD_RANK_RATIO
+            ):
+                # 大きな表では使う次元（＋有効次元の判定用に1つ）だけを求める。
+                # 総慣性は全特異値の2乗和＝残差行列のフロベニウスノルムの2乗
+                total_inertia = float(np.linalg.norm(residuals) ** 2)
+                U, sigma, Vt = svds(
+                    residuals,
+                    k=n_components + 1,
+                    v0=np.random.RandomState(42).uniform(-1, 1, n_short),
+                )
+                # svds は特異値を昇順で返すので降順に並べ替える
+                order = np.argsort(sigma)[::-1]
+                U, sigma, Vt = U[:, order], sigma[order], Vt[order]
+            else:
+                # 特異値分解（残差行列は以降使わないので、有限値チェックを省き
+                # 入力バッファを LAPACK の作業領域として上書きさせる）
+                U, sigma, Vt = svd(
+                    residuals,
+                    full_matrices=False,
+                    lapack_driver="gesdd",
+                    check_finite=False,
+                    overwrite_a=True,
+                )
+                total_inertia = float(np.sum(sigma**2))
 
-            print(f"特異値: {sigma}")
+            logger.debug("特異値: %s", sigma)
 
             # 有効な次元数を決定
             valid_sigma = sigma[sigma > 1e-10]  # 非常に小さい値を除外
             max_dims = len(valid_sigma)
-            n_components = min(n_components, max_dims, df.shape[0] - 1, df.shape[1] - 1)
+            n_components = min(n_components, max_dims, n_rows - 1, n_cols - 1)
 
             if n_components <= 0:
                 n_components = 1
 
-            print(f"使用する次元数: {n_components}")
+            logger.debug("使用する次元数: %s", n_components)
 
             # 固有値（慣性）
             eigenvalues = (valid_sigma[:n_components] ** 2).tolist()
-            total_inertia = float(np.sum(sigma**2))
 
             # 寄与率の計算
             if total_inertia > 0:
@@ -115,18 +223,23 @@ class CorrespondenceAnalyzer(BaseAnalyzer):
             cumulative_inertia = np.cumsum(explained_inertia).tolist()
 
             # 座標の計算
-            try:
+            if max_dims == 0:
+                # 残差がすべて0（行と列が独立）なら慣性がなく、全点が原点に重なる
+                row_coords = np.zeros((n_rows, 2))
+                col_coords = np.zeros((n_cols, 2))
+            else:
+                # 対角行列 D^(-1/2) との積は行ごとのスケーリングなので、
+                # 対角行列を作らずにブロードキャストで掛ける
+                # （r, c は前処理で全ゼロの行・列を除いているので正）
+                dims_sigma = valid_sigma[:n_components]
+
                 # 行座標
-                Dr_inv_sqrt = np.diag(1 / np.sqrt(r.values))
-                row_coords = Dr_inv_sqrt @ U[:, :n_components]
-                for i in range(n_components):
-                    row_coords[:, i] *= valid_sigma[i]
+                r_inv_sqrt = 1 / np.sqrt(r)
+                row_coords = U[:, :n_components] * r_inv_sqrt[:, None] * dims_sigma
 
                 # 列座標
-                Dc_inv_sqrt = np.diag(1 / np.sqrt(c.values))
-                col_coords = Dc_inv_sqrt @ Vt[:n_components, :].T
-                for i in range(n_components):
-                    col_coords[:, i] *= valid_sigma[i]
+                c_inv_sqrt = 1 / np.sqrt(c)
+                col_coords = Vt[:n_components, :].T * c_inv_sqrt[:, None] * dims_sigma
 
                 # 次元が不足している場合はゼロパディング
                 if n_components == 1:
@@ -137,18 +250,20 @@ class CorrespondenceAnalyzer(BaseAnalyzer):
                         [col_coords, np.zeros(col_coords.shape[0])]
                     )
 
-                print(f"行座標形状: {row_coords.shape}")
-                print(f"列座標形状: {col_coords.shape}")
-
-            except Exception as coord_error:
-                print(f"座標計算エラー: {coord_error}")
-                # フォールバック: ゼロ座標
-                row_coords = np.zeros((df.shape[0], 2))
-                col_coords = np.zeros((df.shape[1], 2))
+            logger.debug("行座標形状: %s", row_coords.shape)
+            logger.debug("列座標形状: %s", col_coords.shape)
 
             # カイ二乗検定
+            # Pearson のカイ二乗統計量は 総慣性 × 総度数 なので SVD の結果から求め、
+            # 期待度数表を作り直さない（2×2 表は chi2_contingency が Yates の
+            # 連続修正をかけるため従来どおり計算する）
+            dof = (n_rows - 1) * (n_cols - 1)
             try:
-                chi2_stat, p_value, dof, expected = chi2_contingency(df)
+                if dof == 1:
+                    chi2_stat, p_value, dof, expected = chi2_contingency(A)
+                else:
+                    chi2_stat = total_inertia * N
+                    p_value = chi2.sf(chi2_stat, dof)
             except:
                 chi2_stat, p_value, dof = 0.0, 1.0, 0
 
@@ -168,16 +283,13 @@ class CorrespondenceAnalyzer(BaseAnalyzer):
             return results
 
         except Exception as e:
-            print(f"計算エラー: {str(e)}")
-            import traceback
-
-            print(f"詳細:\n{traceback.format_exc()}")
+            logger.error("計算エラー: %s", e)
             raise
 
     def create_plot(self, results: Dict[str, Any], df: pd.DataFrame) -> str:
         """コレスポンデンス分析のプロットを作成"""
         try:
-            print("=== プロット作成開始 ===")
+            logger.debug("=== プロット作成開始 ===")
 
             row_coords = results["row_coordinates"]
             col_coords = results["column_coordinates"]
@@ -186,34 +298,20 @@ class CorrespondenceAnalyzer(BaseAnalyzer):
             # 日本語フォント設定
             self.setup_japanese_font()
 
-            # データ準備
-            row_df = pd.DataFrame(
-                {
-                    "x": row_coords[:, 0],
-                    "y": row_coords[:, 1],
-                    "type": "イメージ",
-                    "label": [str(name) for name in df.index],
-                    "size": 100,
-                }
-            )
-
-            col_df = pd.DataFrame(
-                {
-                    "x": col_coords[:, 0],
-                    "y": col_coords[:, 1],
-                    "type": "ブランド",
-                    "label": [str(name) for name in df.columns],
-                    "size": 100,
-                }
-            )
-
-            all_points = pd.concat([row_df, col_df], ignore_index=True)
+            # データ準備（行・列の点を1つの座標配列にまとめ、種類ごとの範囲で参照する）
+            n_rows = len(row_coords)
+            points = np.vstack([row_coords[:, :2], col_coords[:, :2]])
+            groups = [
+                ("イメージ", slice(0, n_rows), df.index.astype(str).tolist()),
+                ("ブランド", slice(n_rows, None), df.columns.astype(str).tolist()),
+            ]
 
             # ラベル位置の最適化
-            all_points = self._optimize_label_positions(all_points)
+            label_points = self._optimize_label_positions(points)
 
             # プロット作成
-            fig, ax = plt.subplots(figsize=(14, 11))
+            fig = Figure(figsize=(14, 11))
+            ax = fig.subplots()
 
             # 背景設定
             fig.patch.set_facecolor("white")
@@ -229,7 +327,7 @@ class CorrespondenceAnalyzer(BaseAnalyzer):
                 fontsize=18,
                 fontweight="bold",
                 pad=20,
-                fontfamily=["IPAexGothic", "IPAGothic", "DejaVu Sans", "sans-serif"],
+                fontfamily=self.japanese_font,
                 color="#333333",
             )
 
@@ -238,24 +336,14 @@ class CorrespondenceAnalyzer(BaseAnalyzer):
                     f"第1次元 ({explained_inertia[0]*100:.1f}% の寄与率)",
                     fontsize=14,
                     labelpad=10,
-                    fontfamily=[
-                        "IPAexGothic",
-                        "IPAGothic",
-                        "DejaVu Sans",
-                        "sans-serif",
-                    ],
+                    fontfamily=self.japanese_font,
                     color="#333333",
                 )
                 ax.set_ylabel(
                     f"第2次元 ({explained_inertia[1]*100:.1f}% の寄与率)",
                     fontsize=14,
                     labelpad=10,
-                    fontfamily=[
-                        "IPAexGothic",
-                        "IPAGothic",
-                        "DejaVu Sans",
-                        "sans-serif",
-                    ],
+                    fontfamily=self.japanese_font,
                     color="#333333",
                 )
 
@@ -264,15 +352,42 @@ class CorrespondenceAnalyzer(BaseAnalyzer):
             ax.axvline(x=0, color="gray", linestyle="--", alpha=0.5, zorder=0)
             ax.grid(True, linestyle=":", linewidth=0.5, alpha=0.6)
 
+            # ラベルから点への引き出し線は、距離が一定以上のものだけを
+            # 1つの LineCollection にまとめて描く（注釈を1本ずつ作らない）
+            leader_lengths = np.hypot(*(label_points - points).T)
+            has_leader = leader_lengths > 0.05
+            ax.add_collection(
+                LineCollection(
+                    np.stack([label_points[has_leader], points[has_leader]], axis=1),
+                    colors="gray",
+                    alpha=0.5,
+                    linewidths=0.5,
+                    zorder=1,
+                ),
+                autolim=False,
+            )
+
+            # テキストを境界線付きで表示するときの共通の書式
+            text_kw = dict(
+                fontsize=11,
+                ha="center",
+                va="center",
+                weight="bold",
+                color="black",
+                zorder=5,
+                fontfamily=self.japanese_font,
+                path_effects=[pe.withStroke(linewidth=3, foreground="white")],
+            )
+
             # 各タイプごとにプロット
-            for point_type in all_points["type"].unique():
-                subset = all_points[all_points["type"] == point_type]
+            for point_type, rows, labels in groups:
+                xy = points[rows]
 
                 # マーカーをプロット
                 ax.scatter(
-                    subset["x"],
-                    subset["y"],
-                    s=subset["size"],
+                    xy[:, 0],
+                    xy[:, 1],
+                    s=np.full(len(xy), 100),
                     marker=markers[point_type],
                     c=colors[point_type],
                     label=point_type,
@@ -282,43 +397,11 @@ class CorrespondenceAnalyzer(BaseAnalyzer):
                     zorder=3,
                 )
 
-                # ラベルと矢印を追加
-                for _, row in subset.iterrows():
-                    x, y = row["x"], row["y"]
-                    label_x, label_y = row["label_x"], row["label_y"]
-
-                    # 距離が一定以上の場合のみ矢印を表示
-                    dist = np.sqrt((label_x - x) ** 2 + (label_y - y) ** 2)
-                    if dist > 0.05:
-                        ax.annotate(
-                            "",
-                            xy=(x, y),
-                            xytext=(label_x, label_y),
-                            arrowprops=dict(
-                                arrowstyle="-", color="gray", alpha=0.5, linewidth=0.5
-                            ),
-                            zorder=1,
-                        )
-
-                    # テキストを境界線付きで表示
-                    ax.text(
-                        label_x,
-                        label_y,
-                        row["label"],
-                        fontsize=11,
-                        ha="center",
-                        va="center",
-                        weight="bold",
-                        color="black",
-                        zorder=5,
-                        fontfamily=[
-                            "IPAexGothic",
-                            "IPAGothic",
-                            "DejaVu Sans",
-                            "sans-serif",
-                        ],
-                        path_effects=[pe.withStroke(linewidth=3, foreground="white")],
-                    )
+                # ラベルを追加
+                for (label_x, label_y), label in zip(
+                    label_points[rows].tolist(), labels
+                ):
+                    ax.text(label_x, label_y, label, **text_kw)
 
             # 凡例
             legend = ax.legend(
@@ -329,9 +412,7 @@ class CorrespondenceAnalyzer(BaseAnalyzer):
                 frameon=True,
                 framealpha=0.9,
                 edgecolor="gray",
-                prop={
-                    "family": ["IPAexGothic", "IPAGothic", "DejaVu Sans", "sans-serif"]
-                },
+                prop={"family": self.japanese_font},
             )
             legend.get_frame().set_linewidth(0.8)
 
@@ -357,24 +438,13 @@ class CorrespondenceAnalyzer(BaseAnalyzer):
                         linewidth=0.5,
                     ),
                     verticalalignment="top",
-                    fontfamily=[
-                        "IPAexGothic",
-                        "IPAGothic",
-                        "DejaVu Sans",
-                        "sans-serif",
-                    ],
+                    fontfamily=self.japanese_font,
                     zorder=5,
                 )
 
-            # 座標範囲の設定
-            x_coords = np.concatenate(
-                [all_points["x"].values, all_points["label_x"].values]
-            )
-            y_coords = np.concatenate(
-                [all_points["y"].values, all_points["label_y"].values]
-            )
-            x_min, x_max = np.min(x_coords), np.max(x_coords)
-            y_min, y_max = np.min(y_coords), np.max(y_coords)
+            # 座標範囲の設定（点とラベルを連結せず、それぞれの列の最小・最大から求める）
+            x_min, y_min = np.minimum(points.min(axis=0), label_points.min(axis=0))
+            x_max, y_max = np.maximum(points.max(axis=0), label_points.max(axis=0))
 
             margin = 0.1
             ax.set_xlim(
@@ -392,64 +462,84 @@ class CorrespondenceAnalyzer(BaseAnalyzer):
             # ティック設定
             ax.tick_params(colors="#666666", labelsize=10)
 
-            plt.tight_layout()
+            fig.tight_layout()
 
-            # Base64エンコード
-            plot_base64 = self.save_plot_as_base64(fig)
-            print(f"プロット作成完了")
+            # Base64エンコード（tight_layout 済みなので bbox の計測パスは省く）
+            plot_base64 = self.save_plot_as_base64(fig, bbox_inches=None)
+            logger.debug("プロット作成完了")
             return plot_base64
 
         except Exception as e:
-            print(f"プロット作成エラー: {str(e)}")
-            import traceback
-
-            print(f"詳細:\n{traceback.format_exc()}")
+            logger.error("プロット作成エラー: %s", e)
+            logger.debug("プロット作成エラー詳細", exc_info=True)
             return ""
 
-    def _optimize_label_positions(self, points):
-        """ラベル位置を最適化"""
-        points = points.copy()
-        points["label_x"] = points["x"]
-        points["label_y"] = points["y"]
+    def _optimize_label_positions(self, coords: np.ndarray) -> np.ndarray:
+        """ラベル位置を最適化（点の座標 (n, 2) からラベルの座標 (n, 2) を返す）"""
+        label_coords = coords.copy()
 
         try:
-            coords = points[["x", "y"]].values
-
-            # 距離行列を計算
-            distances = squareform(pdist(coords))
-            np.fill_diagonal(distances, np.inf)
-
-            min_distances = np.min(distances, axis=1)
-            avg_distance = np.median(min_distances)
-            base_offset = avg_distance * 0.3
-
-            for i, (idx, row) in enumerate(points.iterrows()):
-                x, y = row["x"], row["y"]
-
-                # 近隣点の数を計算
-                neighbors = np.sum(distances[i] < avg_distance)
-                density_factor = min(1.0 + (neighbors * 0.15), 2.0)
-
-                # 角度に基づいてオフセットを決定
-                angle = np.arctan2(y, x) if (x != 0 or y != 0) else 0
-
-                if abs(angle) <= np.pi / 4:  # 右方向
-                    dx, dy = base_offset * density_factor, 0
-                elif abs(angle) >= 3 * np.pi / 4:  # 左方向
-                    dx, dy = -base_offset * density_factor, 0
-                elif angle > 0:  # 上方向
-                    dx, dy = 0, base_offset * density_factor
-                else:  # 下方向
-                    dx, dy = 0, -base_offset * density_factor
+            if NUMBA_AVAILABLE:
+                # 距離行列を作らず、点の組を JIT カーネルで直接走査する
+                # （最近傍距離の中央値は2回目の走査の閾値になるので間で求める）
+                points = np.ascontiguousarray(coords, dtype=np.float64)
+                avg_distance = np.median(_nearest_label_distances(points))
+                offsets = _label_offsets(
+                    points,
+                    avg_distance,
+                    avg_distance * LABEL_BASE_OFFSET_RATIO,
+                    LABEL_DENSITY_RATIO,
+                    LABEL_DENSITY_CAP,
+                )
+            else:
+                offsets = self._label_offsets_numpy(coords)
 
-                points.at[idx, "label_x"] = x + dx
-                points.at[idx, "label_y"] = y + dy
+            label_coords = coords + offsets
 
         except Exception as e:
-            print(f"Label optimization warning: {e}")
+            logger.warning("Label optimization warning: %s", e)
             # フォールバック: 元の位置を使用
 
-        return points
+        return label_coords
+
+    def _label_offsets_numpy(self, coords: np.ndarray) -> np.ndarray:
+        """numba がない場合のラベルのオフセット計算 (n, 2)"""
+        # 距離行列を計算（2次元の点なので pdist + squareform で圧縮形式と
+        # 正方形式の2つを作らず、ブロードキャストで正方行列1つに直接求める）
+        dx = coords[:, 0, None] - coords[None, :, 0]
+        dy = coords[:, 1, None] - coords[None, :, 1]
+        distances = dx * dx
+        distances += dy * dy
+        np.sqrt(distances, out=distances)
+        np.fill_diagonal(distances, np.inf)
+
+        min_distances = np.min(distances, axis=1)
+        avg_distance = np.median(min_distances)
+        base_offset = avg_distance * LABEL_BASE_OFFSET_RATIO
+
+        # 全点のオフセットを配列演算でまとめて求め、列ごとに1回で代入する
+        # 近隣点の数に応じてオフセットを広げる
+        neighbors = np.sum(distances < avg_distance, axis=1)
+        offset = base_offset * np.minimum(
+            1.0 + neighbors * LABEL_DENSITY_RATIO, LABEL_DENSITY_CAP
+        )
+
+        # 角度に基づいてオフセットの方向を決定（原点では arctan2 は 0）
+        angles = np.arctan2(coords[:, 1], coords[:, 0])
+        right = np.abs(angles) <= np.pi / 4
+        left = np.abs(angles) >= 3 * np.pi / 4
+        vertical = ~(right | left)
+        up = vertical & (angles > 0)
+        down = vertical & ~(angles > 0)
+
+        dx = np.zeros(len(coords))
+        dy = np.zeros(len(coords))
+        dx[right] = offset[right]
+        dx[left] = -offset[left]
+        dy[up] = offset[up]
+        dy[down] = -offset[down]
+
+        return np.column_stack([dx, dy])
 
     def create_response(
         self,
@@ -461,8 +551,13 @@ class CorrespondenceAnalyzer(BaseAnalyzer):
         plot_base64: str,
     ) -> Dict[str, Any]:
         """レスポンスデータを作成"""
-        row_coords = results["row_coordinates"]
-        col_coords = results["column_coordinates"]
+        # 座標・慣性は配列ごと .tolist() で Python の float に変換し、
+        # 要素ごとの NumPy スカラー経由の float() を避ける
+        row_xy = np.asarray(results["row_coordinates"], dtype=np.float64)[:, :2]
+        col_xy = np.asarray(results["column_coordinates"], dtype=np.float64)[:, :2]
+
+        def as_float_list(key):
+            return np.asarray(results.get(key, []), dtype=np.float64).tolist()
 
         return {
             "success": True,
@@ -471,31 +566,19 @@ class CorrespondenceAnalyzer(BaseAnalyzer):
             "data": {
                 "total_inertia": float(results.get("total_inertia", 0)),
                 "chi2": float(results.get("chi2", 0)),
-                "eigenvalues": [float(x) for x in results.get("eigenvalues", [])],
-                "explained_inertia": [
-                    float(x) for x in results.get("explained_inertia", [])
-                ],
-                "cumulative_inertia": [
-                    float(x) for x in results.get("cumulative_inertia", [])
-                ],
+                "eigenvalues": as_float_list("eigenvalues"),
+                "explained_inertia": as_float_list("explained_inertia"),
+                "cumulative_inertia": as_float_list("cumulative_inertia"),
                 "degrees_of_freedom": results.get("degrees_of_freedom", 0),
                 "plot_image": plot_base64,
                 "coordinates": {
                     "rows": [
-                        {
-                            "name": str(name),
-                            "dimension_1": float(row_coords[i, 0]),
-                            "dimension_2": float(row_coords[i, 1]),
-                        }
-                        for i, name in enumerate(df.index)
+                        {"name": str(name), "dimension_1": x, "dimension_2": y}
+                        for name, (x, y) in zip(df.index, row_xy.tolist())
                     ],
                     "columns": [
-                        {
-                            "name": str(name),
-                            "dimension_1": float(col_coords[i, 0]),
-                            "dimension_2": float(col_coords[i, 1]),
-                        }
-                        for i, name in enumerate(df.columns)
+                        {"name": str(name), "dimension_1": x, "dimension_2": y}
+                        for name, (x, y) in zip(df.columns, col_xy.tolist())
                     ],
                 },
             },
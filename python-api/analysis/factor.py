@@ -4,8 +4,8 @@ import numpy as np
 import matplotlib
 matplotlib.use('Agg')  # GUI無効化
 
-import matplotlib.pyplot as plt
 import matplotlib.patheffects as pe
+from matplotlib.figure import Figure
 
 import seaborn as sns
 from sklearn.decomposition import FactorAnalysis
@@ -451,22 +451,22 @@ class FactorAnalysisAnalyzer(BaseAnalyzer):
             cumulative_variance = results["cumulative_variance"]
 
             # 図のサイズと配置
-            fig = plt.figure(figsize=(16, 12))
+            fig = Figure(figsize=(16, 12))
             fig.patch.set_facecolor("white")
 
             # 1. スクリープロット
-            ax1 = plt.subplot(2, 3, 1)
+            ax1 = fig.add_subplot(2, 3, 1)
             x_pos = range(1, len(eigenvalues) + 1)
-            plt.plot(x_pos, eigenvalues, "bo-", linewidth=2, markersize=8)
-            plt.axhline(y=1, color="r", linestyle="--", alpha=0.7, label="固有値 = 1")
-            plt.xlabel("因子番号")
-            plt.ylabel("固有値")
-            plt.title("スクリープロット")
-            plt.grid(True, alpha=0.3)
-            plt.legend()
+            ax1.plot(x_pos, eigenvalues, "bo-", linewidth=2, markersize=8)
+            ax1.axhline(y=1, color="r", linestyle="--", alpha=0.7, label="固有値 = 1")
+            ax1.set_xlabel("因子番号")
+            ax1.set_ylabel("固有値")
+            ax1.set_title("スクリープロット")
+            ax1.grid(True, alpha=0.3)
+            ax1.legend()
 
             # 2. 因子負荷量のヒートマップ
-            ax2 = plt.subplot(2, 3, 2)
+            ax2 = fig.add_subplot(2, 3, 2)
             factor_labels = [f"因子{i+1}" for i in range(n_factors)]
             loadings_df = pd.DataFrame(
                 loadings, columns=factor_labels, index=feature_names
@@ -479,24 +479,25 @@ class FactorAnalysisAnalyzer(BaseAnalyzer):
                 center=0,
                 fmt=".2f",
                 cbar_kws={"label": "因子負荷量"},
+                ax=ax2,
             )
-            plt.title("因子負荷量ヒートマップ")
-            plt.ylabel("変数")
+            ax2.set_title("因子負荷量ヒートマップ")
+            ax2.set_ylabel("変数")
 
             # 3. 因子得点散布図（因子1 vs 因子2）
             if n_factors >= 2:
-                ax3 = plt.subplot(2, 3, 3)
+                ax3 = fig.add_subplot(2, 3, 3)
                 factor_scores = np.array(results["factor_scores"])
-                plt.scatter(factor_scores[:, 0], factor_scores[:, 1], alpha=0.6, s=50)
-                plt.xlabel(f"因子1 ({explained_variance[0]:.1f}%)")
-                plt.ylabel(f"因子2 ({explained_variance[1]:.1f}%)")
-                plt.title("因子得点プロット")
-                plt.grid(True, alpha=0.3)
+                ax3.scatter(factor_scores[:, 0], factor_scores[:, 1], alpha=0.6, s=50)
+                ax3.set_xlabel(f"因子1 ({explained_variance[0]:.1f}%)")
+                ax3.set_ylabel(f"因子2 ({explained_variance[1]:.1f}%)")
+                ax3.set_title("因子得点プロット")
+                ax3.grid(True, alpha=0.3)
 
             # 4. 共通性のバープロット
-            ax4 = plt.subplot(2, 3, 4)
+            ax4 = fig.add_subplot(2, 3, 4)
             y_pos = np.arange(len(feature_names))
-            bars = plt.barh(y_pos, communalities, alpha=0.7)
+            bars = ax4.barh(y_pos, communalities, alpha=0.7)
 
             # 色分け（共通性の高さに応じて）
             for i, (bar, comm) in enumerate(zip(bars, communalities)):
@@ -507,20 +508,21 @@ class FactorAnalysisAnalyzer(BaseAnalyzer):
                 else:
                     bar.set_color("red")
 
-            plt.yticks(y_pos, feature_names)
-            plt.xlabel("共通性")
-            plt.title("変数別共通性")
-            plt.axvline(x=0.5, color="r", linestyle="--", alpha=0.7, label="閾値=0.5")
-            plt.legend()
+            ax4.set_yticks(y_pos)
+            ax4.set_yticklabels(feature_names)
+            ax4.set_xlabel("共通性")
+            ax4.set_title("変数別共通性")
+            ax4.axvline(x=0.5, color="r", linestyle="--", alpha=0.7, label="閾値=0.5")
+            ax4.legend()
 
             # 5. 因子負荷量の散布図（因子1 vs 因子2）
             if n_factors >= 2:
-                ax5 = plt.subplot(2, 3, 5)
-                plt.scatter(loadings[:, 0], loadings[:, 1], s=100, alpha=0.7)
+                ax5 = fig.add_subplot(2, 3, 5)
+                ax5.scatter(loadings[:, 0], loadings[:, 1], s=100, alpha=0.7)
 
                 # 変数名をプロット
                 for i, var in enumerate(feature_names):
-                    plt.annotate(
+                    ax5.annotate(
                         var,
                         (loadings[i, 0], loadings[i, 1]),
                         xytext=(5, 5),
@@ -531,21 +533,21 @@ class FactorAnalysisAnalyzer(BaseAnalyzer):
                         path_effects=[pe.withStroke(linewidth=2, foreground="white")],
                     )
 
-                plt.xlabel(f"因子1負荷量 ({explained_variance[0]:.1f}%)")
-                plt.ylabel(f"因子2負荷量 ({explained_variance[1]:.1f}%)")
-                plt.title("因子負荷量プロット")
-                plt.axhline(y=0, color="k", linestyle="-", alpha=0.3)
-                plt.axvline(x=0, color="k", linestyle="-", alpha=0.3)
-                plt.grid(True, alpha=0.3)
+                ax5.set_xlabel(f"因子1負荷量 ({explained_variance[0]:.1f}%)")
+                ax5.set_ylabel(f"因子2負荷量 ({explained_variance[1]:.1f}%)")
+                ax5.set_title("因子負荷量プロット")
+                ax5.axhline(y=0, color="k", linestyle="-", alpha=0.3)
+                ax5.axvline(x=0, color="k", linestyle="-", alpha=0.3)
+                ax5.grid(True, alpha=0.3)
 
             # 6. 累積寄与率のプロット
-            ax6 = plt.subplot(2, 3, 6)
+            ax6 = fig.add_subplot(2, 3, 6)
             x_factors = range(1, len(explained_variance) + 1)
 
-            plt.bar(
+            ax6.bar(
                 x_factors, explained_variance, alpha=0.7, label="個別", color="skyblue"
             )
-            plt.plot(
+            ax6.plot(
                 x_factors,
                 cumulative_variance,
                 "ro-",
@@ -554,11 +556,11 @@ class FactorAnalysisAnalyzer(BaseAnalyzer):
                 label="累積",
             )
 
-            plt.xlabel("因子番号")
-            plt.ylabel("説明分散 (%)")
-            plt.title("因子別説明分散")
-            plt.legend()
-            plt.grid(True, alpha=0.3)
+            ax6.set_xlabel("因子番号")
+            ax6.set_ylabel("説明分散 (%)")
+            ax6.set_title("因子別説明分散")
+            ax6.legend()
+            ax6.grid(True, alpha=0.3)
 
             # 全体のタイトル
             assumptions = results["assumptions"]
@@ -574,8 +576,8 @@ class FactorAnalysisAnalyzer(BaseAnalyzer):
                 y=0.98,
             )
 
-            plt.tight_layout()
-            plt.subplots_adjust(top=0.92)
+            fig.tight_layout()
+            fig.subplots_adjust(top=0.92)
 
             # Base64エンコード
             plot_base64 = self.save_plot_as_base64(fig)
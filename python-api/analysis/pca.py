@@ -1,8 +1,8 @@
 from typing import Dict, Any
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
 import matplotlib.patheffects as pe
+from matplotlib.figure import Figure
 import io
 from sklearn.decomposition import PCA
 from sklearn.preprocessing import StandardScaler
@@ -184,7 +184,8 @@ class PCAAnalyzer(BaseAnalyzer):
             sample_names = results["sample_names"]
 
             # サブプロットの作成
-            fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
+            fig = Figure(figsize=(16, 12))
+            (ax1, ax2), (ax3, ax4) = fig.subplots(2, 2)
             fig.patch.set_facecolor("white")
 
             # 1. スコアプロット（第1-2主成分）
@@ -207,28 +208,23 @@ class PCAAnalyzer(BaseAnalyzer):
                     textcoords="offset points",
                     fontsize=9,
                     alpha=0.8,
-                    fontfamily=[
-                        "IPAexGothic",
-                        "IPAGothic",
-                        "DejaVu Sans",
-                        "sans-serif",
-                    ],
+                    fontfamily=self.japanese_font,
                 )
 
             ax1.axhline(y=0, color="gray", linestyle="--", alpha=0.5)
             ax1.axvline(x=0, color="gray", linestyle="--", alpha=0.5)
             ax1.set_xlabel(
                 f"第1主成分 ({explained_variance_ratio[0]*100:.1f}%)",
-                fontfamily=["IPAexGothic", "IPAGothic", "DejaVu Sans", "sans-serif"],
+                fontfamily=self.japanese_font,
             )
             ax1.set_ylabel(
                 f"第2主成分 ({explained_variance_ratio[1]*100:.1f}%)",
-                fontfamily=["IPAexGothic", "IPAGothic", "DejaVu Sans", "sans-serif"],
+                fontfamily=self.japanese_font,
             )
             ax1.set_title(
                 "主成分得点プロット",
                 fontweight="bold",
-                fontfamily=["IPAexGothic", "IPAGothic", "DejaVu Sans", "sans-serif"],
+                fontfamily=self.japanese_font,
             )
             ax1.grid(True, alpha=0.3)
 
@@ -255,28 +251,23 @@ class PCAAnalyzer(BaseAnalyzer):
                         bbox=dict(
                             boxstyle="round,pad=0.3", facecolor="white", alpha=0.8
                         ),
-                        fontfamily=[
-                            "IPAexGothic",
-                            "IPAGothic",
-                            "DejaVu Sans",
-                            "sans-serif",
-                        ],
+                        fontfamily=self.japanese_font,
                     )
 
             ax2.axhline(y=0, color="gray", linestyle="--", alpha=0.5)
             ax2.axvline(x=0, color="gray", linestyle="--", alpha=0.5)
             ax2.set_xlabel(
                 f"第1主成分負荷量",
-                fontfamily=["IPAexGothic", "IPAGothic", "DejaVu Sans", "sans-serif"],
+                fontfamily=self.japanese_font,
             )
             ax2.set_ylabel(
                 f"第2主成分負荷量",
-                fontfamily=["IPAexGothic", "IPAGothic", "DejaVu Sans", "sans-serif"],
+                fontfamily=self.japanese_font,
             )
             ax2.set_title(
                 "主成分負荷量プロット",
                 fontweight="bold",
-                fontfamily=["IPAexGothic", "IPAGothic", "DejaVu Sans", "sans-serif"],
+                fontfamily=self.japanese_font,
             )
             ax2.grid(True, alpha=0.3)
 
@@ -311,23 +302,23 @@ class PCAAnalyzer(BaseAnalyzer):
             ax3_twin.set_ylabel(
                 "累積寄与率 (%)",
                 color="#A23B72",
-                fontfamily=["IPAexGothic", "IPAGothic", "DejaVu Sans", "sans-serif"],
+                fontfamily=self.japanese_font,
             )
             ax3_twin.tick_params(axis="y", labelcolor="#A23B72")
 
             ax3.set_xlabel(
                 "主成分",
-                fontfamily=["IPAexGothic", "IPAGothic", "DejaVu Sans", "sans-serif"],
+                fontfamily=self.japanese_font,
             )
             ax3.set_ylabel(
                 "寄与率 (%)",
                 color="#2E86AB",
-                fontfamily=["IPAexGothic", "IPAGothic", "DejaVu Sans", "sans-serif"],
+                fontfamily=self.japanese_font,
             )
             ax3.set_title(
                 "主成分の寄与率",
                 fontweight="bold",
-                fontfamily=["IPAexGothic", "IPAGothic", "DejaVu Sans", "sans-serif"],
+                fontfamily=self.japanese_font,
             )
             ax3.tick_params(axis="y", labelcolor="#2E86AB")
             ax3.grid(True, alpha=0.3)
@@ -343,12 +334,7 @@ class PCAAnalyzer(BaseAnalyzer):
                     ha="center",
                     va="bottom",
                     fontsize=9,
-                    fontfamily=[
-                        "IPAexGothic",
-                        "IPAGothic",
-                        "DejaVu Sans",
-                        "sans-serif",
-                    ],
+                    fontfamily=self.japanese_font,
                 )
 
             # 4. 情報パネル
@@ -379,7 +365,7 @@ KMO標本妥当性: {results['kmo']:.3f}
                 fontsize=11,
                 verticalalignment="top",
                 bbox=dict(boxstyle="round,pad=0.5", facecolor="#f8f9fa", alpha=0.8),
-                fontfamily=["IPAexGothic", "IPAGothic", "DejaVu Sans", "sans-serif"],
+                fontfamily=self.japanese_font,
             )
 
             # KMO判定基準の追加
@@ -404,10 +390,10 @@ KMO標本妥当性: {results['kmo']:.3f}
                 fontsize=12,
                 fontweight="bold",
                 color="green" if kmo >= 0.7 else "orange" if kmo >= 0.6 else "red",
-                fontfamily=["IPAexGothic", "IPAGothic", "DejaVu Sans", "sans-serif"],
+                fontfamily=self.japanese_font,
             )
 
-            plt.tight_layout()
+            fig.tight_layout()
 
             # Base64エンコード
             plot_base64 = self.save_plot_as_base64(fig)
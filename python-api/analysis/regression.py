@@ -4,6 +4,7 @@ import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.patheffects as pe
+from matplotlib.figure import Figure
 import seaborn as sns
 from sklearn.model_selection import train_test_split
 from sklearn.linear_model import LinearRegression
@@ -297,7 +298,8 @@ class RegressionAnalyzer(BaseAnalyzer):
         self, results: Dict[str, Any], df: pd.DataFrame
     ) -> str:
         """単回帰・多項式回帰のプロット作成"""
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
+        fig = Figure(figsize=(16, 12))
+        (ax1, ax2), (ax3, ax4) = fig.subplots(2, 2)
         fig.patch.set_facecolor("white")
 
         regression_type = results["regression_type"]
@@ -330,17 +332,17 @@ class RegressionAnalyzer(BaseAnalyzer):
             title,
             fontsize=14,
             fontweight="bold",
-            fontfamily=["IPAexGothic", "IPAGothic", "DejaVu Sans", "sans-serif"],
+            fontfamily=self.japanese_font,
         )
         ax1.set_xlabel(
             best_feature,
             fontsize=12,
-            fontfamily=["IPAexGothic", "IPAGothic", "DejaVu Sans", "sans-serif"],
+            fontfamily=self.japanese_font,
         )
         ax1.set_ylabel(
             target_column,
             fontsize=12,
-            fontfamily=["IPAexGothic", "IPAGothic", "DejaVu Sans", "sans-serif"],
+            fontfamily=self.japanese_font,
         )
         ax1.grid(True, alpha=0.3)
         ax1.legend()
@@ -356,17 +358,17 @@ class RegressionAnalyzer(BaseAnalyzer):
             "残差プロット",
             fontsize=14,
             fontweight="bold",
-            fontfamily=["IPAexGothic", "IPAGothic", "DejaVu Sans", "sans-serif"],
+            fontfamily=self.japanese_font,
         )
         ax2.set_xlabel(
             "予測値",
             fontsize=12,
-            fontfamily=["IPAexGothic", "IPAGothic", "DejaVu Sans", "sans-serif"],
+            fontfamily=self.japanese_font,
         )
         ax2.set_ylabel(
             "残差",
             fontsize=12,
-            fontfamily=["IPAexGothic", "IPAGothic", "DejaVu Sans", "sans-serif"],
+            fontfamily=self.japanese_font,
         )
         ax2.grid(True, alpha=0.3)
 
@@ -386,17 +388,17 @@ class RegressionAnalyzer(BaseAnalyzer):
             "予測値 vs 実測値",
             fontsize=14,
             fontweight="bold",
-            fontfamily=["IPAexGothic", "IPAGothic", "DejaVu Sans", "sans-serif"],
+            fontfamily=self.japanese_font,
         )
         ax3.set_xlabel(
             "実測値",
             fontsize=12,
-            fontfamily=["IPAexGothic", "IPAGothic", "DejaVu Sans", "sans-serif"],
+            fontfamily=self.japanese_font,
         )
         ax3.set_ylabel(
             "予測値",
             fontsize=12,
-            fontfamily=["IPAexGothic", "IPAGothic", "DejaVu Sans", "sans-serif"],
+            fontfamily=self.japanese_font,
         )
         ax3.grid(True, alpha=0.3)
 
@@ -451,18 +453,19 @@ class RegressionAnalyzer(BaseAnalyzer):
             transform=ax4.transAxes,
             fontsize=11,
             verticalalignment="top",
-            fontfamily=["IPAexGothic", "IPAGothic", "DejaVu Sans", "sans-serif"],
+            fontfamily=self.japanese_font,
             bbox=dict(boxstyle="round,pad=0.5", facecolor="lightgray", alpha=0.8),
         )
 
-        plt.tight_layout()
+        fig.tight_layout()
         return self.save_plot_as_base64(fig)
 
     def _create_multiple_regression_plot(
         self, results: Dict[str, Any], df: pd.DataFrame
     ) -> str:
         """重回帰分析のプロット作成"""
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
+        fig = Figure(figsize=(16, 12))
+        (ax1, ax2), (ax3, ax4) = fig.subplots(2, 2)
         fig.patch.set_facecolor("white")
 
         target_column = results["target_column"]
@@ -489,17 +492,17 @@ class RegressionAnalyzer(BaseAnalyzer):
             "予測値 vs 実測値",
             fontsize=14,
             fontweight="bold",
-            fontfamily=["IPAexGothic", "IPAGothic", "DejaVu Sans", "sans-serif"],
+            fontfamily=self.japanese_font,
         )
         ax1.set_xlabel(
             "実測値",
             fontsize=12,
-            fontfamily=["IPAexGothic", "IPAGothic", "DejaVu Sans", "sans-serif"],
+            fontfamily=self.japanese_font,
         )
         ax1.set_ylabel(
             "予測値",
             fontsize=12,
-            fontfamily=["IPAexGothic", "IPAGothic", "DejaVu Sans", "sans-serif"],
+            fontfamily=self.japanese_font,
         )
         ax1.grid(True, alpha=0.3)
 
@@ -510,17 +513,17 @@ class RegressionAnalyzer(BaseAnalyzer):
             "残差プロット",
             fontsize=14,
             fontweight="bold",
-            fontfamily=["IPAexGothic", "IPAGothic", "DejaVu Sans", "sans-serif"],
+            fontfamily=self.japanese_font,
         )
         ax2.set_xlabel(
             "予測値",
             fontsize=12,
-            fontfamily=["IPAexGothic", "IPAGothic", "DejaVu Sans", "sans-serif"],
+            fontfamily=self.japanese_font,
         )
         ax2.set_ylabel(
             "残差",
             fontsize=12,
-            fontfamily=["IPAexGothic", "IPAGothic", "DejaVu Sans", "sans-serif"],
+            fontfamily=self.japanese_font,
         )
         ax2.grid(True, alpha=0.3)
 
@@ -539,24 +542,24 @@ class RegressionAnalyzer(BaseAnalyzer):
                 "回帰係数",
                 fontsize=14,
                 fontweight="bold",
-                fontfamily=["IPAexGothic", "IPAGothic", "DejaVu Sans", "sans-serif"],
+                fontfamily=self.japanese_font,
             )
             ax3.set_xlabel(
                 "説明変数",
                 fontsize=12,
-                fontfamily=["IPAexGothic", "IPAGothic", "DejaVu Sans", "sans-serif"],
+                fontfamily=self.japanese_font,
             )
             ax3.set_ylabel(
                 "係数値",
                 fontsize=12,
-                fontfamily=["IPAexGothic", "IPAGothic", "DejaVu Sans", "sans-serif"],
+                fontfamily=self.japanese_font,
             )
             ax3.set_xticks(range(len(feature_names)))
             ax3.set_xticklabels(
                 feature_names,
                 rotation=45,
                 ha="right",
-                fontfamily=["IPAexGothic", "IPAGothic", "DejaVu Sans", "sans-serif"],
+                fontfamily=self.japanese_font,
             )
             ax3.grid(True, alpha=0.3)
             ax3.axhline(y=0, color="red", linestyle="-", alpha=0.5)
@@ -584,24 +587,24 @@ class RegressionAnalyzer(BaseAnalyzer):
                 "回帰係数（重要度上位10変数）",
                 fontsize=14,
                 fontweight="bold",
-                fontfamily=["IPAexGothic", "IPAGothic", "DejaVu Sans", "sans-serif"],
+                fontfamily=self.japanese_font,
             )
             ax3.set_xlabel(
                 "説明変数",
                 fontsize=12,
-                fontfamily=["IPAexGothic", "IPAGothic", "DejaVu Sans", "sans-serif"],
+                fontfamily=self.japanese_font,
             )
             ax3.set_ylabel(
                 "係数値",
                 fontsize=12,
-                fontfamily=["IPAexGothic", "IPAGothic", "DejaVu Sans", "sans-serif"],
+                fontfamily=self.japanese_font,
             )
             ax3.set_xticks(range(len(top_names)))
             ax3.set_xticklabels(
                 top_names,
                 rotation=45,
                 ha="right",
-                fontfamily=["IPAexGothic", "IPAGothic", "DejaVu Sans", "sans-serif"],
+                fontfamily=self.japanese_font,
             )
             ax3.grid(True, alpha=0.3)
             ax3.axhline(y=0, color="red", linestyle="-", alpha=0.5)
@@ -643,11 +646,11 @@ class RegressionAnalyzer(BaseAnalyzer):
             transform=ax4.transAxes,
             fontsize=11,
             verticalalignment="top",
-            fontfamily=["IPAexGothic", "IPAGothic", "DejaVu Sans", "sans-serif"],
+            fontfamily=self.japanese_font,
             bbox=dict(boxstyle="round,pad=0.5", facecolor="lightgray", alpha=0.8),
         )
 
-        plt.tight_layout()
+        fig.tight_layout()
         return self.save_plot_as_base64(fig)
 
     def _save_regression_coordinates(
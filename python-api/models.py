@@ -129,7 +129,8 @@ class OriginalData(Base):
     csv_data = Column(Text, nullable=False)
     row_names = Column(ARRAY(String))
     column_names = Column(ARRAY(String))
-    data_matrix = Column(JSONB)
+    data_matrix = Column(JSONB)  # 旧形式（行ごとの dict）。読み出し専用、004 で削除
+    data_matrix_blob = Column(LargeBinary)  # np.save 形式（shape/dtype ヘッダ付き）
 
     # リレーション
     session = relationship("AnalysisSession", back_populates="original_data")
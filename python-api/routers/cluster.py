@@ -1,13 +1,21 @@
 # python-api/routers/cluster.py
 from fastapi import APIRouter, HTTPException, UploadFile, File, Form, Depends
-from fastapi.responses import Response
+from fastapi.responses import ORJSONResponse, Response
 from sqlalchemy.orm import Session
 from typing import Optional, List
 import pandas as pd
+import numpy as np
 import io
+import logging
 
 from models import get_db
-from analysis.cluster import ClusterAnalyzer
+from analysis.cluster import (
+    ClusterAnalyzer,
+    SILHOUETTE_SAMPLE_SIZE,
+    kmeans_n_init,
+)
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/cluster", tags=["cluster"])
 
@@ -46,10 +54,10 @@ async def analyze_cluster(
     - min_samples: 最小サンプル数 (DBSCAN用)
     """
     try:
-        print(f"=== クラスター解析API開始 ===")
-        print(f"ファイル: {file.filename}")
-        print(f"手法: {method}, クラスター数: {n_clusters}")
-        print(f"ユーザーID: {user_id}, セッション名: {session_name}")
+        logger.debug("=== クラスター解析API開始 ===")
+        logger.debug("ファイル: %s", file.filename)
+        logger.debug("手法: %s, クラスター数: %s", method, n_clusters)
+        logger.debug("ユーザーID: %s, セッション名: %s", user_id, session_name)
 
         # ファイル検証
         if not file.filename.endswith(".csv"):
@@ -62,9 +70,9 @@ async def analyze_cluster(
             csv_content = await file.read()
             csv_text = csv_content.decode("utf-8")
             df = pd.read_csv(io.StringIO(csv_text), index_col=0)
-            print(f"CSV読み込み完了: {df.shape}")
+            logger.debug("CSV読み込み完了: %s", df.shape)
         except Exception as e:
-            print(f"CSV読み込みエラー: {e}")
+            logger.error("CSV読み込みエラー: %s", e)
             raise HTTPException(
                 status_code=400, detail=f"CSVファイルの読み込みに失敗しました: {str(e)}"
             )
@@ -109,16 +117,15 @@ async def analyze_cluster(
             **kwargs,
         )
 
-        print(f"クラスター解析完了: session_id={result['session_id']}")
-        return result
+        logger.debug("クラスター解析完了: session_id=%s", result["session_id"])
+        # 分析結果は NumPy 配列のまま保持し、orjson で直接シリアライズする
+        return ORJSONResponse(result)
 
     except HTTPException:
         raise
     except Exception as e:
-        print(f"クラスター解析API全体エラー: {str(e)}")
-        import traceback
-
-        print(f"詳細:\n{traceback.format_exc()}")
+        logger.error("クラスター解析API全体エラー: %s", e)
+        logger.debug("クラスター解析API全体エラー詳細", exc_info=True)
         raise HTTPException(
             status_code=500, detail=f"クラスター解析中にエラーが発生しました: {str(e)}"
         )
@@ -168,7 +175,7 @@ async def suggest_optimal_clusters(
     最適なクラスター数の提案（エルボー法とシルエット分析）
     """
     try:
-        print(f"最適クラスター数分析開始: {file.filename}")
+        logger.debug("最適クラスター数分析開始: %s", file.filename)
 
         # CSVファイルを読み込み
         csv_content = await file.read()
@@ -180,29 +187,50 @@ async def suggest_optimal_clusters(
 
         # データの前処理
         analyzer = ClusterAnalyzer()
-        df_processed = analyzer._preprocess_data(df, standardize)
+        data = analyzer._preprocess_data(df, standardize)
 
         # K=2からmax_kまでの評価
         from sklearn.cluster import KMeans
         from sklearn.metrics import silhouette_score
+        from scipy.spatial.distance import pdist, squareform
 
         max_k = min(max_k, len(df) - 1)
         results = {"k_values": [], "inertias": [], "silhouette_scores": []}
 
+        # ペアワイズ距離はKに依存しないので一度だけ計算し、各Kのシルエット係数で再利用。
+        # 大規模データは O(n²) になるため固定のサンプルに限定して近似する
+        sample_index = np.arange(len(data))
+        if len(data) > SILHOUETTE_SAMPLE_SIZE:
+            sample_index = np.random.RandomState(42).permutation(len(data))[
+                :SILHOUETTE_SAMPLE_SIZE
+            ]
+            results["silhouette_sample_size"] = SILHOUETTE_SAMPLE_SIZE
+        distances = squareform(pdist(data[sample_index], metric="euclidean"))
+
+        # K-means は analyze と同じく単精度で学習してメモリ転送量を半分にする
+        # （シルエット係数用の距離は桁落ちを避けるため倍精度のまま）
+        X = np.ascontiguousarray(data, dtype=np.float32)
+
         for k in range(2, max_k + 1):
             try:
-                kmeans = KMeans(n_clusters=k, random_state=42, n_init=10)
-                labels = kmeans.fit_predict(df_processed)
+                kmeans = KMeans(
+                    n_clusters=k,
+                    random_state=42,
+                    n_init=kmeans_n_init(len(X), k, X.shape[1], 10),
+                )
+                labels = kmeans.fit_predict(X)
 
                 inertia = kmeans.inertia_
-                silhouette = silhouette_score(df_processed, labels)
+                silhouette = silhouette_score(
+                    distances, labels[sample_index], metric="precomputed"
+                )
 
                 results["k_values"].append(k)
                 results["inertias"].append(float(inertia))
                 results["silhouette_scores"].append(float(silhouette))
 
             except Exception as e:
-                print(f"K={k}での評価エラー: {e}")
+                logger.error("K=%dでの評価エラー: %s", k, e)
 
         # 最適クラスター数の推定
         if results["silhouette_scores"]:
@@ -241,7 +269,7 @@ async def suggest_optimal_clusters(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"最適クラスター数分析エラー: {e}")
+        logger.error("最適クラスター数分析エラー: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"最適クラスター数の分析中にエラーが発生しました: {str(e)}",
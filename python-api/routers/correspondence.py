@@ -1,6 +1,6 @@
 # python-api/routers/correspondence.py
 from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 import pandas as pd
 import io
@@ -62,7 +62,7 @@ async def analyze_correspondence(
         )
 
         print("=== API処理完了 ===")
-        return JSONResponse(content=response_data)
+        return ORJSONResponse(content=response_data)
 
     except HTTPException:
         raise
@@ -1,5 +1,5 @@
 from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 import pandas as pd
 import numpy as np
@@ -97,7 +97,7 @@ async def analyze_factor(
         )
 
         print("=== 因子分析API処理完了 ===")
-        return JSONResponse(content=response_data)
+        return ORJSONResponse(content=response_data)
 
     except HTTPException:
         raise
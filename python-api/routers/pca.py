@@ -1,5 +1,5 @@
 from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 import pandas as pd
 import io
@@ -64,7 +64,7 @@ async def analyze_pca(
         )
 
         print("=== PCA API処理完了 ===")
-        return JSONResponse(content=response_data)
+        return ORJSONResponse(content=response_data)
 
     except HTTPException:
         raise
@@ -1,6 +1,6 @@
 # python-api/routers/regression.py
 from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 import pandas as pd
 import io
@@ -83,7 +83,7 @@ async def analyze_regression(
         )
 
         print("=== 回帰分析API処理完了 ===")
-        return JSONResponse(content=response_data)
+        return ORJSONResponse(content=response_data)
 
     except HTTPException:
         raise
@@ -16,6 +16,7 @@ from models import (
     AnalysisMetadata,
     get_db,
 )
+from utils.database_helper import decode_data_matrix
 
 router = APIRouter(prefix="/sessions", tags=["sessions"])
 
@@ -476,11 +477,16 @@ async def download_original_csv(
         if hasattr(original_data, "csv_data") and original_data.csv_data:
             print("Found csv_data field")
             csv_content = original_data.csv_data
-        # 2. data_matrixから復元
-        elif hasattr(original_data, "data_matrix") and original_data.data_matrix:
+        # 2. data_matrix_blob（なければ旧形式の data_matrix）から復元
+        elif original_data.data_matrix_blob or original_data.data_matrix:
             try:
                 print("Attempting to reconstruct from data_matrix...")
-                df = pd.DataFrame(original_data.data_matrix)
+                if original_data.data_matrix_blob:
+                    df = pd.DataFrame(
+                        decode_data_matrix(original_data.data_matrix_blob)
+                    )
+                else:
+                    df = pd.DataFrame(original_data.data_matrix)
 
                 # 行名・列名を設定
                 if hasattr(original_data, "row_names") and original_data.row_names:
@@ -0,0 +1,57 @@
+# python-api/tests/test_cluster.py
+import numpy as np
+from sklearn.cluster import AgglomerativeClustering
+from sklearn.metrics import adjusted_rand_score, silhouette_score
+
+from analysis.cluster import SILHOUETTE_SAMPLE_SIZE, ClusterAnalyzer
+
+
+def test_hierarchical_tied_heights_returns_requested_clusters():
+    """併合の高さが同じ組があっても指定したクラスター数に切り分ける"""
+    X = np.array(
+        [[0, 0], [0, 1], [10, 0], [10, 1], [20, 0], [20, 1]], dtype=np.float32
+    )
+
+    labels = ClusterAnalyzer()._hierarchical_clustering(X, 4)["labels"]
+
+    assert len(np.unique(labels)) == 4
+    assert sorted(np.bincount(labels).tolist()) == [1, 1, 2, 2]
+
+
+def test_hierarchical_matches_agglomerative_on_binary_data():
+    """二値データ（高さが同じ併合が多い）でも AgglomerativeClustering と同じ分割になる"""
+    X = np.random.default_rng(0).integers(0, 2, (300, 8)).astype(np.float32)
+
+    for linkage_method in ("ward", "average", "complete", "single"):
+        analyzer = ClusterAnalyzer()
+        analyzer._binary_mode = True
+        labels = analyzer._hierarchical_clustering(X, 10, linkage=linkage_method)[
+            "labels"
+        ]
+        expected = AgglomerativeClustering(
+            n_clusters=10, linkage=linkage_method
+        ).fit_predict(X)
+
+        assert len(np.unique(labels)) == 10
+        assert adjusted_rand_score(labels, expected) == 1.0
+
+
+def test_sampled_silhouette_ignores_clusters_missing_from_sample():
+    """サンプルに1点もないクラスターがあっても sklearn のサンプリング値と一致する"""
+    rng = np.random.default_rng(0)
+    n_samples = 12_003
+    sample = np.random.RandomState(42).permutation(n_samples)[:SILHOUETTE_SAMPLE_SIZE]
+
+    # 大きな2クラスターと、サンプルに入らない行に置いた3点のクラスター
+    labels = np.arange(n_samples) % 2
+    labels[np.setdiff1d(np.arange(n_samples), sample)[:3]] = 2
+    centers = np.array([[0.0, 0.0], [10.0, 10.0], [-10.0, -10.0]])
+    X = centers[labels] + rng.normal(0.0, 1.0, (n_samples, 2))
+
+    metrics = ClusterAnalyzer()._calculate_evaluation_metrics(X, labels)
+
+    expected = silhouette_score(
+        X, labels, sample_size=SILHOUETTE_SAMPLE_SIZE, random_state=42
+    )
+    assert metrics["silhouette_sample_size"] == SILHOUETTE_SAMPLE_SIZE
+    assert np.isclose(metrics["silhouette_score"], expected)
@@ -2,7 +2,9 @@ from sqlalchemy.orm import Session
 from typing import Dict, Any, List, Optional
 from fastapi import UploadFile
 import pandas as pd
+import numpy as np
 import base64
+import io
 
 from models import (
     AnalysisSession,
@@ -70,9 +72,9 @@ async def save_analysis_to_db(
         )
     # 他の分析手法も同様に追加
 
+    # ID 採番のために flush のみ行い、コミットは最後に1回だけ（途中で失敗しても残骸を残さない）
     db.add(analysis_session)
-    db.commit()
-    db.refresh(analysis_session)
+    db.flush()
     session_id = analysis_session.id
 
     # 2. 元データを保存
@@ -81,7 +83,7 @@ async def save_analysis_to_db(
         csv_data=csv_text,
         row_names=list(df.index),
         column_names=list(df.columns),
-        data_matrix=df.to_dict("records"),
+        data_matrix_blob=encode_data_matrix(df),
     )
     db.add(original_data)
 
@@ -116,48 +118,61 @@ async def save_coordinates_data(
     analysis_type = analyzer.get_analysis_type()
 
     if analysis_type == "correspondence":
-        # コレスポンデンス分析の座標データ
+        # コレスポンデンス分析の座標データ（行座標・列座標）
         coordinates = analyzer.get_coordinates_data(results)
-
-        # 行座標を保存
-        for coord in coordinates["rows"]:
-            coords = CoordinatesData(
-                session_id=session_id,
-                point_type="row",
-                point_name=coord["name"],
-                dimension_1=coord["dimension_1"],
-                dimension_2=coord["dimension_2"],
-            )
-            db.add(coords)
-
-        # 列座標を保存
-        for coord in coordinates["columns"]:
-            coords = CoordinatesData(
-                session_id=session_id,
-                point_type="column",
-                point_name=coord["name"],
-                dimension_1=coord["dimension_1"],
-                dimension_2=coord["dimension_2"],
+        for point_type, key in (("row", "rows"), ("column", "columns")):
+            points = coordinates[key]
+            _bulk_insert_coordinates(
+                db,
+                session_id,
+                point_type,
+                [coord["name"] for coord in points],
+                [coord["dimension_1"] for coord in points],
+                [coord["dimension_2"] for coord in points],
             )
-            db.add(coords)
 
     elif analysis_type == "pca":
-        # 主成分分析の場合は主成分スコアを保存
+        # 主成分分析の場合は主成分スコアを保存（iterrows を使わず列単位で取り出す）
         if "scores" in results:
             scores = results["scores"]
-            for i, (idx, row) in enumerate(scores.iterrows()):
-                coords = CoordinatesData(
-                    session_id=session_id,
-                    point_type="observation",
-                    point_name=str(idx),
-                    dimension_1=float(row.iloc[0]) if len(row) > 0 else 0,
-                    dimension_2=float(row.iloc[1]) if len(row) > 1 else 0,
-                )
-                db.add(coords)
+            values = scores.to_numpy(dtype=np.float64)
+            zeros = np.zeros(len(values))
+            _bulk_insert_coordinates(
+                db,
+                session_id,
+                "observation",
+                scores.index.astype(str).tolist(),
+                (values[:, 0] if values.shape[1] > 0 else zeros).tolist(),
+                (values[:, 1] if values.shape[1] > 1 else zeros).tolist(),
+            )
 
     # 他の分析手法も同様に実装
 
 
+def _bulk_insert_coordinates(
+    db: Session,
+    session_id: int,
+    point_type: str,
+    names: List[str],
+    dim1: List[float],
+    dim2: List[float],
+):
+    """座標データを ORM オブジェクトを作らずに一括 INSERT"""
+    db.bulk_insert_mappings(
+        CoordinatesData,
+        [
+            {
+                "session_id": session_id,
+                "point_type": point_type,
+                "point_name": name,
+                "dimension_1": x,
+                "dimension_2": y,
+            }
+            for name, x, y in zip(names, dim1, dim2)
+        ],
+    )
+
+
 async def save_eigenvalue_data(
     db: Session, session_id: int, results: Dict[str, Any], analysis_type: str
 ):
@@ -199,13 +214,33 @@ async def save_eigenvalue_data(
                 db.add(eigenvalue_data)
 
 
+def encode_data_matrix(df: pd.DataFrame) -> Optional[bytes]:
+    """データ行列を np.save 形式のバイト列に変換（行ごとの dict を作らない）
+
+    数値化できない列を含む場合は None を返す（元データは csv_data に残る）
+    """
+    try:
+        values = np.ascontiguousarray(df.to_numpy(dtype=np.float64))
+    except (TypeError, ValueError):
+        return None
+
+    buffer = io.BytesIO()
+    np.save(buffer, values, allow_pickle=False)
+    return buffer.getvalue()
+
+
+def decode_data_matrix(data: bytes) -> np.ndarray:
+    """encode_data_matrix で保存したバイト列を配列に戻す"""
+    return np.load(io.BytesIO(data), allow_pickle=False)
+
+
 def extract_parameters(results: Dict[str, Any], analysis_type: str) -> Dict[str, Any]:
     """分析結果から分析パラメータを抽出"""
     parameters = {"analysis_type": analysis_type}
 
     if analysis_type == "correspondence":
         parameters.update(
-            {"n_components": results.get("n_components", 2), "method": "prince"}
+            {"n_components": results.get("n_components", 2), "method": "svd"}
         )
     elif analysis_type == "pca":
         parameters.update(